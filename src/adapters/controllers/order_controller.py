@@ -1,3 +1,4 @@
+from concurrent.futures import Executor
 from datetime import datetime
 
 
@@ -29,13 +30,18 @@ class OrderController:
     """Controller for order-related HTTP endpoints"""
 
     def __init__(
-        self, order_repository: OrderRepository, presenter: PresenterInterface
+        self,
+        order_repository: OrderRepository,
+        presenter: PresenterInterface,
+        catalog_executor: Executor | None = None,
     ):
         self.order_repository = order_repository
         self.presenter = presenter
 
         # Initialize use cases
-        self.create_use_case = OrderCreateUseCase(order_repository)
+        self.create_use_case = OrderCreateUseCase(
+            order_repository, catalog_executor=catalog_executor
+        )
         self.read_use_case = OrderReadUseCase(order_repository)
         self.update_use_case = OrderUpdateUseCase(order_repository)
         self.cancel_use_case = OrderCancelUseCase(order_repository)
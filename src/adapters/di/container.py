@@ -1,3 +1,6 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from src.application.repositories.order_repository import OrderRepository
 from src.adapters.gateways.sql_order_repository import SQLOrderRepository
 from src.adapters.gateways.http_product_repository import HTTPProductRepository
@@ -18,6 +21,13 @@ class Container:
     - It's part of the Frameworks & Drivers layer
     - It creates the concrete implementations
     - It manages the dependency graph
+
+    The module-level ``container`` is shared by every request, so the
+    components it builds (and their connection pools) live for the whole
+    process and are released by ``close()`` on shutdown. HTTP clients read
+    their host and token from SSM once; a client built without a host (SSM
+    unreachable at first use) is rebuilt on the next request, while rotated
+    parameters are picked up on restart.
     """
 
     def __init__(self, database_url: str = None):
@@ -28,53 +38,98 @@ class Container:
         self._ingredient_repository = None
         self._payment_client = None
         self._presenter: PresenterInterface = None
+        self._catalog_executor: ThreadPoolExecutor = None
+        # Request handlers run in a thread pool; build each component only once
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _has_host(client) -> bool:
+        """Whether an HTTP client was built and resolved its service host"""
+        return client is not None and bool(client.base_url)
 
     @property
     def database(self) -> DatabaseInterface:
         """Get database instance"""
-        if self._database is None:
-            self._database = SQLAlchemyDatabase(self.database_url)
+        with self._lock:
+            if self._database is None:
+                self._database = SQLAlchemyDatabase(self.database_url)
         return self._database
 
     @property
     def order_repository(self) -> OrderRepository:
         """Get order repository instance"""
-        if self._order_repository is None:
-            self._order_repository = SQLOrderRepository(
-                self.database,
-                product_repository=self.product_repository,
-                ingredient_repository=self.ingredient_repository,
-            )
+        with self._lock:
+            product_repository = self.product_repository
+            ingredient_repository = self.ingredient_repository
+            # Follow HTTP clients rebuilt since the repository was created
+            if (
+                self._order_repository is None
+                or self._order_repository.product_repository is not product_repository
+                or self._order_repository.ingredient_repository
+                is not ingredient_repository
+            ):
+                self._order_repository = SQLOrderRepository(
+                    self.database,
+                    product_repository=product_repository,
+                    ingredient_repository=ingredient_repository,
+                )
         return self._order_repository
 
     @property
     def product_repository(self):
         """Get product repository client (catalog service)"""
-        if self._product_repository is None:
-            self._product_repository = HTTPProductRepository()
+        with self._lock:
+            if not self._has_host(self._product_repository):
+                if self._product_repository is not None:
+                    self._product_repository.close()
+                self._product_repository = HTTPProductRepository()
         return self._product_repository
 
     @property
     def ingredient_repository(self):
         """Get ingredient repository client (catalog service)"""
-        if self._ingredient_repository is None:
-            self._ingredient_repository = HTTPIngredientRepository()
+        with self._lock:
+            if not self._has_host(self._ingredient_repository):
+                self._ingredient_repository = HTTPIngredientRepository()
         return self._ingredient_repository
 
     @property
     def payment_client(self):
         """Get payment service HTTP client"""
-        if self._payment_client is None:
-            self._payment_client = HTTPPaymentClient()
+        with self._lock:
+            if not self._has_host(self._payment_client):
+                self._payment_client = HTTPPaymentClient()
         return self._payment_client
 
     @property
     def presenter(self) -> PresenterInterface:
         """Get presenter instance"""
-        if self._presenter is None:
-            self._presenter = JSONPresenter()
+        with self._lock:
+            if self._presenter is None:
+                self._presenter = JSONPresenter()
         return self._presenter
 
+    @property
+    def catalog_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool used to fan out catalog requests for an order"""
+        with self._lock:
+            if self._catalog_executor is None:
+                self._catalog_executor = ThreadPoolExecutor(
+                    max_workers=8, thread_name_prefix="catalog"
+                )
+        return self._catalog_executor
+
+    def close(self):
+        """Release pooled connections held by the built components"""
+        with self._lock:
+            if self._database is not None:
+                self._database.dispose()
+            if self._product_repository is not None:
+                self._product_repository.close()
+            if self._catalog_executor is not None:
+                self._catalog_executor.shutdown()
+            self.reset()
+
     def reset(self):
         """Reset all dependencies (useful for testing)"""
         self._database = None
@@ -83,6 +138,7 @@ class Container:
         self._ingredient_repository = None
         self._payment_client = None
         self._presenter = None
+        self._catalog_executor = None
 
 
 # Global container instance
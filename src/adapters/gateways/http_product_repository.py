@@ -1,7 +1,12 @@
+import copy
 import os
-from typing import List, Optional
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.application.repositories.product_repository import ProductRepository
 from src.entities.product import Product, ProductCategory, ProductReceiptItem
@@ -10,13 +15,67 @@ from src.entities.value_objects.sku import SKU
 from src.entities.value_objects.money import Money
 from src.config.aws_ssm import get_ssm_client
 
+_MISSING = object()
+
+
+class _TTLCache:
+    """Small thread-safe in-process cache with a per-entry time to live."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or _MISSING if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value that expires after ttl seconds"""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a key if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide read-aside cache of deserialized products, keyed on
+# (base_url, internal_id, include_inactive) so invalidate() reaches every
+# repository instance
+_product_cache = _TTLCache(maxsize=1024)
+
+
 class HTTPProductRepository(ProductRepository):
     """HTTP client to fetch product data from the catalog service."""
 
     def __init__(self, 
         base_url: Optional[str] = None, 
         timeout: int = 5,
-        token: Optional[str] = None
+        token: Optional[str] = None,
+        cache_ttl: float = 30,
+        not_found_ttl: float = 5,
     ):
         self.base_url = get_ssm_client().get_parameter(
             "/ordering-system/catalog/apigateway/url",
@@ -34,6 +93,29 @@ class HTTPProductRepository(ProductRepository):
         os.getenv("CATALOG_API_TOKEN")
         self.timeout = timeout
 
+        # Keep-alive connection pool reused across catalog lookups
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._cache = _product_cache
+        self.cache_ttl = cache_ttl
+        self.not_found_ttl = not_found_ttl
+
+    def close(self) -> None:
+        """Release the pooled catalog connections"""
+        self._session.close()
+
     def _get(self, path: str):
         if not self.base_url:
             raise ValueError("CATALOG_API_HOST is not configured")
@@ -41,8 +123,8 @@ class HTTPProductRepository(ProductRepository):
         url = f"{self.base_url}{path}"
         print(url)
         try:
-            resp = requests.get(
-                url, 
+            resp = self._session.get(
+                url,
                 timeout=self.timeout,
                 headers={"Authorization": f"{self.token}"} if self.token else {}
             )
@@ -88,29 +170,72 @@ class HTTPProductRepository(ProductRepository):
 
     def find_by_id(
         self, product_internal_id: int, include_inactive: bool = False
+    ) -> Optional[Product]:
+        key = (self.base_url, product_internal_id, include_inactive)
+        product = self._cache.get(key)
+        if product is _MISSING:
+            product = self._fetch_product(product_internal_id, include_inactive)
+            # Missing products are cached for a shorter time so new ones show up quickly
+            self._cache.set(
+                key, product, self.cache_ttl if product else self.not_found_ttl
+            )
+        # Callers get their own copy so changes never leak into the cache
+        return copy.deepcopy(product)
+
+    def invalidate(self, product_internal_id: int) -> None:
+        """Drop any cached lookups for the given product"""
+        for include_inactive in (False, True):
+            self._cache.pop((self.base_url, product_internal_id, include_inactive))
+
+    def _fetch_product(
+        self, product_internal_id: int, include_inactive: bool
     ) -> Optional[Product]:
         data = self._get(
             f"/product/by-id/{product_internal_id}?include_inactive={str(include_inactive).lower()}"
         )
         if not data:
             return None
-        
+        return self._build_product(data, {})
+
+    def _fetch_ingredient(
+        self, ingredient_internal_id, ingredients: Dict[Any, Optional[Ingredient]]
+    ) -> Optional[Ingredient]:
+        """Fetch an ingredient, reusing entries already present in ingredients"""
+        if ingredient_internal_id not in ingredients:
+            ingredient_response = self._get(
+                f"/ingredient/by-id/{ingredient_internal_id}?include_inactive=false"
+            )
+            ingredients[ingredient_internal_id] = (
+                Ingredient(**self._map_ingredient_fields(ingredient_response))
+                if ingredient_response
+                else None
+            )
+        return ingredients[ingredient_internal_id]
+
+    def _build_product(
+        self, data: dict, ingredients: Dict[Any, Optional[Ingredient]]
+    ) -> Product:
+        """Convert a catalog product payload into a Product entity"""
+        data = dict(data)
+
         # Convert price
         if "price" in data and not isinstance(data["price"], Money):
             if isinstance(data["price"], (int, float)):
                 data["price"] = Money(amount=data["price"])
             elif isinstance(data["price"], dict) and "amount" in data["price"]:
                 data["price"] = Money(**data["price"])
+
+        # Convert category to ProductCategory; the catalog sends its string value
+        if "category" in data:
+            data["category"] = ProductCategory(data["category"])
         
         # Convert default_ingredient
         default_ingredients = []
         for ing_data in data.get("default_ingredient", []):
-            ingredient_response = self._get(
-                f"/ingredient/by-id/{ing_data.get('ingredient_internal_id')}?include_inactive=false"
+            ingredient_obj = self._fetch_ingredient(
+                ing_data.get("ingredient_internal_id"), ingredients
             )
-            if ingredient_response:
-                ingredient_response = self._map_ingredient_fields(ingredient_response)
-                ingredient_obj = Ingredient(**ingredient_response)
+            if ingredient_obj:
                 default_ingredients.append(
                     ProductReceiptItem(
                         ingredient=ingredient_obj,
@@ -1,6 +1,7 @@
 from typing import List, Optional, TypeVar, Dict, Any
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.adapters.gateways.interfaces.database_interface import DatabaseInterface
@@ -8,6 +9,20 @@ from src.config.database import db_config
 
 T = TypeVar("T")
 
+# Compiled-statement cache entries per engine (SQLAlchemy default is 500); the
+# repositories issue the same handful of query shapes per entity class
+QUERY_CACHE_SIZE = 1200
+
+# QueuePool tuning for server databases: LIFO keeps reuse on a few warm
+# connections so idle overflow ones can be recycled. The engine is built once
+# per process by the shared container, so the pool outlives single requests
+POOL_OPTIONS: Dict[str, Any] = {
+    "pool_use_lifo": True,
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_timeout": 30,
+}
+
 
 class SQLAlchemyDatabase(DatabaseInterface):
     """
@@ -20,19 +35,51 @@ class SQLAlchemyDatabase(DatabaseInterface):
     - It provides a clean abstraction for database operations
     """
 
-    def __init__(self, database_url: str = None):
+    def __init__(
+        self, database_url: str = None, pool_options: Optional[Dict[str, Any]] = None
+    ):
         if database_url is None:
             database_url = db_config.connection_string
 
+        # SQLite uses its own single-connection pools, which reject QueuePool sizing
+        if pool_options is None:
+            is_sqlite = make_url(database_url).get_backend_name() == "sqlite"
+            pool_options = {} if is_sqlite else POOL_OPTIONS
+
         # Create engine with PostgreSQL-specific settings
         self.engine = create_engine(
-            database_url, pool_pre_ping=True, pool_recycle=300, echo=False
+            database_url,
+            pool_pre_ping=True,
+            pool_recycle=300,
+            echo=False,
+            query_cache_size=QUERY_CACHE_SIZE,
+            **pool_options,
         )
 
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
 
+        # Queryable attribute names per entity class, built on first lookup
+        self._field_cache: Dict[type, frozenset] = {}
+
+    def _fields(self, entity_class: type) -> frozenset:
+        """Get the attribute names a query may filter on for an entity class"""
+        fields = self._field_cache.get(entity_class)
+        if fields is None:
+            mapper = getattr(entity_class, "__mapper__", None)
+            fields = frozenset(mapper.attrs.keys() if mapper else dir(entity_class))
+            self._field_cache[entity_class] = fields
+        return fields
+
+    def _get_field(self, entity_class: type, field_name: str):
+        """Get a filterable class attribute, raising AttributeError for unknown names"""
+        if field_name not in self._fields(entity_class):
+            raise AttributeError(
+                f"{entity_class.__name__} has no attribute '{field_name}'"
+            )
+        return getattr(entity_class, field_name)
+
     def get_session(self) -> Session:
         """Get a database session"""
         return self.SessionLocal()
@@ -69,13 +116,10 @@ class SQLAlchemyDatabase(DatabaseInterface):
     def find_by_id(
         self, session: Session, entity_class: type, entity_id: int
     ) -> Optional[T]:
-        """Find an entity by ID"""
+        """Find an entity by ID (its internal_id primary key)"""
         try:
-            return (
-                session.query(entity_class)
-                .filter(entity_class.internal_id == entity_id)
-                .first()
-            )
+            # Served from the identity map when the entity is already loaded
+            return session.get(entity_class, entity_id)
         except SQLAlchemyError as e:
             raise ValueError(f"Error finding entity by ID: {e}")
 
@@ -91,7 +135,7 @@ class SQLAlchemyDatabase(DatabaseInterface):
     ) -> Optional[T]:
         """Find an entity by a specific field value"""
         try:
-            field = getattr(entity_class, field_name)
+            field = self._get_field(entity_class, field_name)
             return session.query(entity_class).filter(field == field_value).first()
         except SQLAlchemyError as e:
             raise ValueError(f"Error finding entity by field: {e}")
@@ -103,7 +147,7 @@ class SQLAlchemyDatabase(DatabaseInterface):
     ) -> List[T]:
         """Find all entities by a specific field value"""
         try:
-            field = getattr(entity_class, field_name)
+            field = self._get_field(entity_class, field_name)
             return session.query(entity_class).filter(field == field_value).all()
         except SQLAlchemyError as e:
             raise ValueError(f"Error finding entities by field: {e}")
@@ -115,7 +159,7 @@ class SQLAlchemyDatabase(DatabaseInterface):
     ) -> List[T]:
         """Find all entities by a boolean field value"""
         try:
-            field = getattr(entity_class, field_name)
+            field = self._get_field(entity_class, field_name)
             return session.query(entity_class).filter(field == field_value).all()
         except SQLAlchemyError as e:
             raise ValueError(f"Error finding entities by boolean field: {e}")
@@ -127,11 +171,12 @@ class SQLAlchemyDatabase(DatabaseInterface):
     ) -> List[T]:
         """Find all entities by multiple field values"""
         try:
-            query = session.query(entity_class)
-            for field_name, field_value in field_values.items():
-                field = getattr(entity_class, field_name)
-                query = query.filter(field == field_value)
-            return query.all()
+            conditions = [
+                self._get_field(entity_class, field_name) == field_value
+                for field_name, field_value in field_values.items()
+            ]
+            # One filter() call ANDs every condition without cloning the query per field
+            return session.query(entity_class).filter(*conditions).all()
         except SQLAlchemyError as e:
             raise ValueError(f"Error finding entities by multiple fields: {e}")
         except AttributeError as e:
@@ -142,7 +187,7 @@ class SQLAlchemyDatabase(DatabaseInterface):
     ) -> bool:
         """Check if an entity exists by a specific field value"""
         try:
-            field = getattr(entity_class, field_name)
+            field = self._get_field(entity_class, field_name)
             return (
                 session.query(entity_class).filter(field == field_value).first()
                 is not None
@@ -173,3 +218,7 @@ class SQLAlchemyDatabase(DatabaseInterface):
             session.close()
         except SQLAlchemyError as e:
             raise ValueError(f"Error closing session: {e}")
+
+    def dispose(self) -> None:
+        """Close every pooled connection"""
+        self.engine.dispose()
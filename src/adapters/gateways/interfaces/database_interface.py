@@ -97,3 +97,8 @@ class DatabaseInterface(ABC):
     def close_session(self, session: Session) -> None:
         """Close the session"""
         pass
+
+    @abstractmethod
+    def dispose(self) -> None:
+        """Close every pooled connection"""
+        pass
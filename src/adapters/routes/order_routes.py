@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
 
 from src.adapters.controllers.order_controller import OrderController
-from src.adapters.di.container import Container
+from src.adapters.di.container import container
 from src.application.use_cases.order_use_cases import OrderPaymentRequestUseCase
 from src.entities.value_objects.order_status import OrderStatusType
 
@@ -114,14 +114,16 @@ order_router = APIRouter(tags=["order"], prefix="/order")
 
 # Dependency injection function
 def get_order_controller() -> OrderController:
-    """Get order controller with dependencies"""
-    container = Container()
+    """Get order controller with dependencies from the process-wide container"""
+    order_repository = container.order_repository
     controller = OrderController(
-        order_repository=container.order_repository, presenter=container.presenter
+        order_repository=order_repository,
+        presenter=container.presenter,
+        catalog_executor=container.catalog_executor,
     )
     # injeta use case de request_payment com client HTTP externo
     controller.payment_request_use_case = OrderPaymentRequestUseCase(
-        container.order_repository, container.payment_client
+        order_repository, container.payment_client
     )
     return controller
 
@@ -1,5 +1,7 @@
 import os
-from typing import List, Optional
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
 
 from src.application.repositories.order_repository import OrderRepository
@@ -13,7 +15,7 @@ from src.application.dto.implementation.order_dto import (
     PaymentRequestResponse,
 )
 from src.entities.order import Order, OrderItem
-from src.entities.product import Product
+from src.entities.product import Product, ProductCategory, ProductReceiptItem
 from src.entities.ingredient import Ingredient
 from src.config.aws_ssm import get_ssm_client
 
@@ -29,25 +31,32 @@ class OrderCreateUseCase:
     def __init__(
         self,
         order_repository: OrderRepository,
+        catalog_executor: Optional[Executor] = None,
     ):
         self.order_repository = order_repository
+        # Owned by the caller (the DI container); without one, fetch sequentially
+        self.catalog_executor = catalog_executor
 
-    def _fetch_catalog(self, path: str):
-        """Fetch a resource from catalog service with basic validation"""
+    def _catalog_fetcher(self) -> Callable[[str], Any]:
+        """Resolve the catalog host and token once and bind them to _fetch_catalog"""
+        ssm_client = get_ssm_client()
 
-        host = get_ssm_client().get_parameter(
+        host = ssm_client.get_parameter(
             "/ordering-system/catalog/apigateway/url",
             decrypt=True
         )  or \
         os.getenv("CATALOG_API_HOST")
 
-        token = get_ssm_client().get_parameter(
+        token = ssm_client.get_parameter(
             "/ordering-system/catalog/apigateway/token",
             decrypt=True
         )  or \
         os.getenv("CATALOG_API_TOKEN")
 
+        return partial(self._fetch_catalog, host=host, token=token)
 
+    def _fetch_catalog(self, path: str, host: Optional[str], token: Optional[str]):
+        """Fetch a resource from catalog service with basic validation"""
         if not host:
             raise ValueError("CATALOG_API_HOST is not configured")
 
@@ -101,10 +110,115 @@ class OrderCreateUseCase:
         
         return mapped
 
+    def _fetch_catalog_many(
+        self, fetch: Callable[[str], Any], paths: List[str]
+    ) -> Dict[str, Any]:
+        """Fetch several catalog resources concurrently, once per distinct path.
+
+        A failed fetch is stored under its path and re-raised by _lookup, so
+        errors surface in the order resources are validated, not fetched.
+        """
+
+        def fetch_or_error(path: str):
+            try:
+                return fetch(path)
+            except Exception as exc:
+                return exc
+
+        unique_paths = list(dict.fromkeys(paths))
+        if self.catalog_executor is None or len(unique_paths) <= 1:
+            return {path: fetch_or_error(path) for path in unique_paths}
+
+        return dict(
+            zip(unique_paths, self.catalog_executor.map(fetch_or_error, unique_paths))
+        )
+
+    @staticmethod
+    def _lookup(catalog: Dict[str, Any], path: str):
+        """Get a prefetched catalog resource, raising its fetch error if it failed"""
+        resource = catalog[path]
+        if isinstance(resource, Exception):
+            raise resource
+        return resource
+
+    @staticmethod
+    def _product_path(product_internal_id) -> str:
+        return f"/product/by-id/{product_internal_id}?include_inactive=false"
+
+    @staticmethod
+    def _ingredient_path(ingredient_internal_id) -> str:
+        return f"/ingredient/by-id/{ingredient_internal_id}?include_inactive=false"
+
+    def _active_product(self, catalog: Dict[str, Any], product_id) -> Product:
+        """Build a product that may be added to a new order"""
+        product_request = self._lookup(catalog, self._product_path(product_id))
+        if not product_request:
+            raise ValueError(
+                f"Product with ID {product_id} not found or is deactivated"
+            )
+
+        # Additional validation: ensure product is active for new orders
+        if not product_request["is_active"]:
+            raise ValueError(
+                f"Product with ID {product_id} is deactivated and cannot be added to new orders"
+            )
+
+        # Copy so the prefetched payload is never mutated
+        product_request = dict(product_request)
+
+        # Convert price to Money object if needed
+        if "price" in product_request and not isinstance(product_request["price"], Money):
+            if isinstance(product_request["price"], (int, float)):
+                product_request["price"] = Money(amount=product_request["price"])
+            elif isinstance(product_request["price"], dict) and "amount" in product_request["price"]:
+                product_request["price"] = Money(**product_request["price"])
+
+        # Convert category to ProductCategory; the catalog sends its string value
+        if "category" in product_request:
+            product_request["category"] = ProductCategory(product_request["category"])
+
+        # Convert default_ingredient from dict to ProductReceiptItem objects
+        default_ingredients = []
+        for ing_data in product_request.get("default_ingredient", []):
+            ingredient_response = self._lookup(
+                catalog, self._ingredient_path(ing_data.get("ingredient_internal_id"))
+            )
+            if not ingredient_response:
+                raise ValueError(
+                    f"Ingredient with ID {ing_data.get('ingredient_internal_id')} not found"
+                )
+
+            ingredient_response = self._map_ingredient_fields(ingredient_response)
+            ingredient_obj = Ingredient(**ingredient_response)
+            default_ingredients.append(
+                ProductReceiptItem(
+                    ingredient=ingredient_obj,
+                    quantity=ing_data.get("quantity", 1)
+                )
+            )
+
+        product_request["default_ingredient"] = default_ingredients
+        return Product(**product_request)
+
+    def _active_ingredient(self, catalog: Dict[str, Any], ing_id) -> Ingredient:
+        """Build an ingredient that may be added to or removed from a new order"""
+        ingredient = self._lookup(catalog, self._ingredient_path(ing_id))
+        if not ingredient:
+            raise ValueError(
+                f"Ingredient with ID {ing_id} not found or is deactivated"
+            )
+        if not ingredient["is_active"]:
+            raise ValueError(
+                f"Ingredient with ID {ing_id} is deactivated and cannot be added to new orders"
+            )
+        return Ingredient(**self._map_ingredient_fields(ingredient))
+
     def execute(self, request: OrderCreateRequest) -> OrderResponse:
         """Execute the order creation use case"""
+        fetch = self._catalog_fetcher()
+
         # Validate customer exists
-        customer = self._fetch_catalog(
+        customer = fetch(
             f"/customer/by-id/{request.customer_internal_id}?include_inactive=false"
         )
 
@@ -120,94 +234,55 @@ class OrderCreateUseCase:
         ):
             raise ValueError("Customer does not meet requirements to place orders")
 
-        # Build order items
-        order_items = []
+        # Prefetch every product, then every ingredient the order refers to;
+        # validation below still walks each item's product before its ingredients
+        catalog = self._fetch_catalog_many(
+            fetch,
+            [
+                self._product_path(item_request.product_internal_id)
+                for item_request in request.order_items
+            ],
+        )
+        ingredient_paths = []
         for item_request in request.order_items:
-            # Get product - only allow active products for new orders
-            product_request = self._fetch_catalog(
-                f"/product/by-id/{item_request.product_internal_id}?include_inactive=false"
-            )
-            if not product_request:
-                raise ValueError(
-                    f"Product with ID {item_request.product_internal_id} not found or is deactivated"
+            product_request = catalog[self._product_path(item_request.product_internal_id)]
+            if isinstance(product_request, dict):
+                ingredient_paths.extend(
+                    self._ingredient_path(ing_data.get("ingredient_internal_id"))
+                    for ing_data in product_request.get("default_ingredient", [])
                 )
-
-            # Additional validation: ensure product is active for new orders
-            if not product_request["is_active"]:
-                raise ValueError(
-                    f"Product with ID {item_request.product_internal_id} is deactivated and cannot be added to new orders"
+            ingredient_paths.extend(
+                self._ingredient_path(ing_id)
+                for ing_id in (
+                    *item_request.additional_ingredient_internal_ids,
+                    *item_request.remove_ingredient_internal_ids,
                 )
+            )
+        catalog.update(self._fetch_catalog_many(fetch, ingredient_paths))
 
-            # Convert price to Money object if needed
-            if "price" in product_request and not isinstance(product_request["price"], Money):
-                if isinstance(product_request["price"], (int, float)):
-                    product_request["price"] = Money(amount=product_request["price"])
-                elif isinstance(product_request["price"], dict) and "amount" in product_request["price"]:
-                    product_request["price"] = Money(**product_request["price"])
-
-            # Convert default_ingredient from dict to ProductReceiptItem objects
-            from src.entities.product import ProductReceiptItem
-            default_ingredients = []
-            for ing_data in product_request.get("default_ingredient", []):
-                # Fetch complete ingredient data from catalog
-                ingredient_response = self._fetch_catalog(
-                    f"/ingredient/by-id/{ing_data.get('ingredient_internal_id')}?include_inactive=false"
-                )
-                if not ingredient_response:
-                    raise ValueError(
-                        f"Ingredient with ID {ing_data.get('ingredient_internal_id')} not found"
-                    )
-                
-                ingredient_response = self._map_ingredient_fields(ingredient_response)
-                ingredient_obj = Ingredient(**ingredient_response)
-                default_ingredients.append(
-                    ProductReceiptItem(
-                        ingredient=ingredient_obj,
-                        quantity=ing_data.get("quantity", 1)
-                    )
-                )
-            
-            product_request["default_ingredient"] = default_ingredients
-            product = Product(**product_request)
-
-            # Get additional ingredients - only allow active ingredients for new orders
-            additional_ingredients = []
-            for ing_id in item_request.additional_ingredient_internal_ids:
-                ingredient = self._fetch_catalog(
-                    f"/ingredient/by-id/{ing_id}?include_inactive=false"
-                )
-                if not ingredient:
-                    raise ValueError(
-                        f"Ingredient with ID {ing_id} not found or is deactivated"
-                    )
-                if not ingredient["is_active"]:
-                    raise ValueError(
-                        f"Ingredient with ID {ing_id} is deactivated and cannot be added to new orders"
-                    )
-                ingredient = self._map_ingredient_fields(ingredient)
-                additional_ingredients.append(Ingredient(**ingredient))
-
-            # Get remove ingredients - only allow active ingredients for new orders
-            remove_ingredients = []
-            for ing_id in item_request.remove_ingredient_internal_ids:
-                ingredient = self._fetch_catalog(
-                    f"/ingredient/by-id/{ing_id}?include_inactive=false"
-                )
-                if not ingredient:
-                    raise ValueError(
-                        f"Ingredient with ID {ing_id} not found or is deactivated"
-                    )
-                if not ingredient["is_active"]:
-                    raise ValueError(
-                        f"Ingredient with ID {ing_id} is deactivated and cannot be added to new orders"
-                    )
-                ingredient = self._map_ingredient_fields(ingredient)
-                remove_ingredients.append(Ingredient(**ingredient))
+        # Build order items
+        products = {}
+        order_items = []
+        for item_request in request.order_items:
+            # Get product - only allow active products for new orders
+            product_id = item_request.product_internal_id
+            if product_id not in products:
+                products[product_id] = self._active_product(catalog, product_id)
+
+            # Get additional and remove ingredients - only allow active ingredients for new orders
+            additional_ingredients = [
+                self._active_ingredient(catalog, ing_id)
+                for ing_id in item_request.additional_ingredient_internal_ids
+            ]
+            remove_ingredients = [
+                self._active_ingredient(catalog, ing_id)
+                for ing_id in item_request.remove_ingredient_internal_ids
+            ]
 
             # Create order item
             order_item = OrderItem(
                 order_internal_id=0,  # Will be set by Order entity
-                product=product,
+                product=products[product_id],
                 additional_ingredient=additional_ingredients,
                 remove_ingredient=remove_ingredients,
             )
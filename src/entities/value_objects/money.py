@@ -3,7 +3,7 @@ from typing import Union
 from dataclasses import dataclass
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class Money:
     """
     Money value object that represents a valid monetary amount.
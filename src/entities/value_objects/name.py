@@ -3,8 +3,11 @@ import re
 
 from src.config.app_config import app_config
 
+# Letters, spaces, and common name characters
+_NAME_RE = re.compile(r"^[a-zA-ZÀ-ÿ\s\'-]+$")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Name:
     """
     Name value object that represents a valid Name.
@@ -26,16 +29,17 @@ class Name:
     @staticmethod
     def _is_valid_name(name: str) -> bool:
         """Validate name format"""
-        if not name or name.strip() == "":
+        if not name:
+            return False
+        stripped = name.strip()
+        if stripped == "":
             return False
         if (
-            len(name.strip()) < app_config.min_name_length
-            or len(name.strip()) > app_config.max_name_length
+            len(stripped) < app_config.min_name_length
+            or len(stripped) > app_config.max_name_length
         ):
             return False
-        # Check if name contains only letters, spaces, and common name characters
-        pattern = r"^[a-zA-ZÀ-ÿ\s\'-]+$"
-        return bool(re.match(pattern, name.strip()))
+        return bool(_NAME_RE.match(stripped))
 
     def __str__(self) -> str:
         return self.value
@@ -11,7 +11,15 @@ class OrderStatusType(str, Enum):
     CANCELADO = "CANCELADO"
 
 
-@dataclass(frozen=True)
+# Forward transitions; FINALIZADO and CANCELADO have no next status
+_NEXT_STATUS = {
+    OrderStatusType.RECEBIDO: OrderStatusType.EM_PREPARACAO,
+    OrderStatusType.EM_PREPARACAO: OrderStatusType.PRONTO,
+    OrderStatusType.PRONTO: OrderStatusType.FINALIZADO,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class OrderStatus:
     """
     OrderStatus value object that represents a valid order status.
@@ -77,18 +85,10 @@ class OrderStatus:
 
     def next_status(self) -> Optional["OrderStatus"]:
         """Get the next status in the flow"""
-        flow = [
-            OrderStatusType.RECEBIDO,
-            OrderStatusType.EM_PREPARACAO,
-            OrderStatusType.PRONTO,
-            OrderStatusType.FINALIZADO,
-        ]
-        try:
-            current_index = flow.index(self.status)
-            next_status = flow[current_index + 1]
-            return OrderStatus(status=next_status)
-        except (ValueError, IndexError):
+        next_status = _NEXT_STATUS.get(self.status)
+        if next_status is None:
             return None  # Already at FINALIZADO or invalid
+        return OrderStatus(status=next_status)
 
     def previous_status(self) -> Optional["OrderStatus"]:
         """Get the previous status in the flow"""
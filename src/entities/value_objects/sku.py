@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 import re
 
+_SKU_RE = re.compile(r"^[A-Za-z]+-\d{4}-[A-Za-z]{3}$")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SKU:
     """
     SKU value object that represents a valid SKU.
@@ -28,8 +30,7 @@ class SKU:
         if not (len(values) > 8 and len(values) < 15):
             return False
 
-        format_pattern = r"^[A-Za-z]+-\d{4}-[A-Za-z]{3}$"
-        if not re.match(format_pattern, values):
+        if not _SKU_RE.match(values):
             return False
 
         return True
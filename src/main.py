@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
@@ -5,16 +7,25 @@ from src.app_logs import configure_logging, LogLevels
 from src.config.app_config import app_config
 from src.adapters.routes.health_routes import health_router
 from src.adapters.routes.order_routes import order_router
+from src.adapters.di.container import container
 
 configure_logging(LogLevels.info.value)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the shared database and catalog connection pools on shutdown
+    container.close()
+
+
 def create_application() -> FastAPI:
     app = FastAPI(
         title=app_config.api_title,
         version=app_config.api_version,
         description=app_config.api_description,
         prefix=app_config.api_prefix,
+        lifespan=lifespan,
     )
 
     app.add_middleware(CORSMiddleware, **app_config.cors_config)
@@ -5,12 +5,54 @@ import pytest
 
 sys.path.append(os.getcwd())
 
-# Mock boto3 SSM client globally to prevent AWS calls in all tests
+def pytest_collection_modifyitems(session, config, items):
+    """Fail collection when two test modules share a file name"""
+    modules = {}
+    for item in items:
+        first = modules.setdefault(item.path.name, item.path)
+        if first != item.path:
+            raise pytest.UsageError(
+                f"Duplicate test module name '{item.path.name}': {first} and {item.path}"
+            )
+
+
+# Mock boto3 SSM client globally to prevent AWS calls in all tests. It starts in
+# pytest_configure because src.config.database reads SSM at import time, which
+# happens during collection, before any fixture runs
+_boto3_client_patch = patch("boto3.client")
+_MOCK_BOTO3 = pytest.StashKey()
+
+
+def pytest_configure(config):
+    """Patch boto3.client before collection imports any application module"""
+    mock_boto3 = _boto3_client_patch.start()
+    mock_ssm_client = MagicMock()
+    mock_ssm_client.get_parameter.return_value = {"Parameter": {"Value": None}}
+    mock_boto3.return_value = mock_ssm_client
+    config.stash[_MOCK_BOTO3] = mock_boto3
+
+
+def pytest_unconfigure(config):
+    _boto3_client_patch.stop()
+
+
 @pytest.fixture(scope="session", autouse=True)
-def mock_boto3_ssm():
-    """Mock boto3 SSM client globally to prevent AWS API calls during tests"""
-    with patch("boto3.client") as mock_boto3:
-        mock_ssm_client = MagicMock()
-        mock_ssm_client.get_parameter.return_value = {"Parameter": {"Value": None}}
-        mock_boto3.return_value = mock_ssm_client
-        yield mock_boto3
+def mock_boto3_ssm(pytestconfig):
+    """The boto3.client mock; drops any SSM client cached before it was active"""
+    from src.config import aws_ssm
+
+    aws_ssm._ssm_client = None
+    return pytestconfig.stash[_MOCK_BOTO3]
+
+
+@pytest.fixture(scope="session")
+def test_client(mock_boto3_ssm):
+    """Create a single test client for the whole session.
+
+    The app is imported inside the fixture so the boto3 SSM mock is already
+    active when the routers resolve their dependencies.
+    """
+    from fastapi.testclient import TestClient
+    from src.main import app
+
+    return TestClient(app)
@@ -0,0 +1,269 @@
+import copy
+import json
+
+import pytest
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from src.adapters.gateways.implementations.sqlalchemy_database import SQLAlchemyDatabase
+from src.application.dto.implementation.order_dto import OrderResponse
+from src.entities.order import Order, OrderItem
+from src.entities.ingredient import Ingredient, IngredientType
+from src.entities.product import Product, ProductCategory, ProductReceiptItem
+from src.entities.value_objects.money import Money
+from src.entities.value_objects.name import Name
+from src.entities.value_objects.sku import SKU
+
+
+@pytest.fixture(scope="session")
+def name_queijo():
+    return Name.create("Queijo")
+
+
+@pytest.fixture(scope="session")
+def name_burger():
+    return Name.create("Burger")
+
+
+@pytest.fixture(scope="session")
+def sku_abc():
+    return SKU.create("ABC-1234-XYZ")
+
+
+@pytest.fixture(scope="session")
+def money_1():
+    return Money(amount=1.0)
+
+
+@pytest.fixture(scope="session")
+def money_10():
+    return Money(amount=10.0)
+
+
+@pytest.fixture(scope="session")
+def cheese_ingredient(name_queijo, money_1):
+    """Read-only cheese ingredient shared across the session"""
+    return Ingredient(
+        name=name_queijo,
+        price=money_1,
+        is_active=True,
+        type=IngredientType.CHEESE,
+        applies_to_burger=True,
+        applies_to_side=False,
+        applies_to_drink=False,
+        applies_to_dessert=False,
+        internal_id=1,
+    )
+
+
+@pytest.fixture(scope="session")
+def dummy_burger_product(cheese_ingredient, name_burger, money_10, sku_abc):
+    """Read-only active burger product shared across the session"""
+    return Product(
+        name=name_burger,
+        price=money_10,
+        category=ProductCategory.BURGER,
+        sku=sku_abc,
+        default_ingredient=[ProductReceiptItem(cheese_ingredient, 1)],
+        is_active=True,
+        internal_id=1,
+    )
+
+
+@pytest.fixture
+def dummy_product(dummy_burger_product):
+    """Per-test shallow copy of ``dummy_burger_product``"""
+    return copy.copy(dummy_burger_product)
+
+
+@pytest.fixture
+def make_order_item(dummy_burger_product):
+    """Build a fresh OrderItem for ``dummy_burger_product``; keyword overrides replace defaults"""
+
+    def make(**overrides):
+        fields = {
+            "order_internal_id": 1,
+            "product": dummy_burger_product,
+            "additional_ingredient": [],
+            "remove_ingredient": [],
+        }
+        fields.update(overrides)
+        return OrderItem(**fields)
+
+    return make
+
+
+@pytest.fixture
+def burger_order_item(make_order_item):
+    """Fresh single-burger OrderItem"""
+    return make_order_item()
+
+
+@pytest.fixture(scope="session")
+def burger_order(dummy_burger_product):
+    """Single-burger order built once per session; treat as read-only"""
+    item = OrderItem(
+        order_internal_id=1,
+        product=dummy_burger_product,
+        additional_ingredient=[],
+        remove_ingredient=[],
+    )
+    return Order.create(customer_internal_id=1, order_items=[item])
+
+
+@pytest.fixture(scope="session")
+def order_response(burger_order):
+    """OrderResponse DTO for ``burger_order``; treat as read-only"""
+    return OrderResponse.from_entity(burger_order)
+
+
+@pytest.fixture
+def fresh_order(burger_order):
+    """Factory returning a mutable deep copy of ``burger_order``"""
+    return lambda: copy.deepcopy(burger_order)
+
+
+class FakeTransport(BaseAdapter):
+    """requests transport adapter that answers from a URL -> response table.
+
+    Handlers map a full URL to a ``(status, body)`` tuple or to an exception
+    instance that is raised instead. Unknown URLs answer 404.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.handlers = {}
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        handler = self.handlers.get(request.url, (404, None))
+        if isinstance(handler, Exception):
+            raise handler
+
+        status, body = handler
+        response = Response()
+        response.status_code = status
+        response.headers["Content-Type"] = "application/json"
+        response._content = b"" if body is None else json.dumps(body).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+    def reset(self):
+        self.handlers.clear()
+        self.requests.clear()
+
+
+@pytest.fixture(scope="session")
+def _fake_transport():
+    return FakeTransport()
+
+
+@pytest.fixture
+def fake_transport(_fake_transport):
+    """Session-wide fake transport, emptied before each test"""
+    _fake_transport.reset()
+    return _fake_transport
+
+
+@pytest.fixture(scope="session")
+def in_memory_db():
+    """One SQLite in-memory SQLAlchemyDatabase for the whole run; tests use only its methods"""
+    return SQLAlchemyDatabase(database_url="sqlite:///:memory:")
+
+
+class FakeQuery:
+    """Chainable stand-in for session.query(...) returning preset results"""
+
+    def __init__(self):
+        self.first_result = None
+        self.all_result = []
+        self.filters = []
+        self.offset_args = []
+        self.limit_args = []
+
+    def filter(self, *criteria):
+        self.filters.append(criteria)
+        return self
+
+    def offset(self, skip):
+        self.offset_args.append(skip)
+        return self
+
+    def limit(self, limit):
+        self.limit_args.append(limit)
+        return self
+
+    def first(self):
+        return self.first_result
+
+    def all(self):
+        return self.all_result
+
+
+class FakeSession:
+    """Call-recording Session stand-in; an exception in side_effects[name] makes that method raise"""
+
+    def __init__(self):
+        self.calls = []
+        self.side_effects = {}
+        self.results = FakeQuery()
+        self.identity_map = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def count(self, name):
+        """Number of recorded calls to the named method"""
+        return sum(1 for call in self.calls if call[0] == name)
+
+    def _record(self, name, *args):
+        self.calls.append((name, *args))
+        error = self.side_effects.get(name)
+        if error is not None:
+            raise error
+
+    def add(self, entity):
+        self._record("add", entity)
+
+    def flush(self):
+        self._record("flush")
+
+    def merge(self, entity):
+        self._record("merge", entity)
+        return entity
+
+    def delete(self, entity):
+        self._record("delete", entity)
+
+    def get(self, entity_class, ident):
+        self._record("get", entity_class, ident)
+        return self.identity_map.get((entity_class, ident))
+
+    def query(self, entity_class):
+        self._record("query", entity_class)
+        return self.results
+
+    def refresh(self, entity):
+        self._record("refresh", entity)
+
+    def commit(self):
+        self._record("commit")
+
+    def rollback(self):
+        self._record("rollback")
+
+    def close(self):
+        self._record("close")
+
+
+@pytest.fixture
+def fake_session():
+    return FakeSession()
@@ -7,8 +7,14 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
-from src.adapters.gateways.http_product_repository import HTTPProductRepository
-from src.entities.product import Product
+from src.adapters.gateways.http_product_repository import (
+    HTTPProductRepository,
+    _product_cache,
+)
+from src.entities.product import ProductCategory
+from src.entities.value_objects.sku import SKU
+
+CATALOG_URL = "https://catalog-service.local"
 
 
 @pytest.fixture
@@ -21,17 +27,44 @@ def mock_ssm_client():
         yield mock
 
 
-@pytest.fixture
-def product_repo(mock_ssm_client):
-    """Fixture to create HTTPProductRepository with test base URL"""
-    return HTTPProductRepository(base_url="catalog-service.local", timeout=5)
+@pytest.fixture(autouse=True)
+def clear_product_cache():
+    """The product cache is process-wide; start every test empty"""
+    _product_cache.clear()
 
 
 @pytest.fixture
-def mock_requests_get():
-    """Fixture to mock requests.get"""
-    with patch("src.adapters.gateways.http_product_repository.requests.get") as mock_get:
-        yield mock_get
+def product_repo(mock_ssm_client, fake_transport):
+    """Fixture to create HTTPProductRepository wired to the fake catalog transport"""
+    repo = HTTPProductRepository(base_url=CATALOG_URL, timeout=5)
+    repo._session.mount("https://", fake_transport)
+    return repo
+
+
+def make_product_payload(internal_id=1, is_active=True, category="burger"):
+    return {
+        "name": "Test Product",
+        "price": 10.0,
+        "is_active": is_active,
+        "default_ingredient": [{"ingredient_internal_id": 1, "quantity": 1}],
+        "category": category,
+        "sku": "P-1234-ABC",
+        "internal_id": internal_id,
+    }
+
+
+def make_ingredient_payload(ingredient_type="cheese"):
+    return {
+        "name": "Cheese",
+        "price": {"amount": 1.0},
+        "is_active": True,
+        "type": ingredient_type,
+        "internal_id": 1,
+    }
+
+
+PRODUCT_URL = f"{CATALOG_URL}/product/by-id/{{}}?include_inactive={{}}"
+INGREDIENT_URL = f"{CATALOG_URL}/ingredient/by-id/1?include_inactive=false"
 
 
 def test_init_with_base_url(mock_ssm_client):
@@ -57,6 +90,17 @@ def test_init_with_custom_timeout(mock_ssm_client):
     assert repo.timeout == 10
 
 
+def test_init_mounts_pooled_adapter(mock_ssm_client):
+    """Given repository is initialized, when inspecting its session, then a pooled adapter with retries is mounted"""
+    repo = HTTPProductRepository(base_url="test.local")
+
+    adapter = repo._session.get_adapter("https://catalog-service.local")
+
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == 2
+    assert repo._session.get_adapter("http://catalog-service.local") is adapter
+
+
 def test_get_without_base_url(mock_ssm_client):
     """Given no base_url configured, when _get is called, then raises ValueError"""
     with patch.dict("os.environ", {}, clear=True):
@@ -70,39 +114,28 @@ def test_get_without_base_url(mock_ssm_client):
         assert "CATALOG_API_HOST is not configured" in error_msg or "Failed to reach catalog service" in error_msg
 
 
-def test_get_uses_https(mock_requests_get, product_repo):
+def test_get_uses_https(fake_transport, product_repo):
     """Given base URL, when _get is called, then constructs URL correctly"""
-    mock_response = MagicMock()
-    mock_response.ok = True
-    mock_response.json.return_value = {"internal_id": 1}
-    mock_requests_get.return_value = mock_response
+    fake_transport.handlers[f"{CATALOG_URL}/product/by-id/1"] = (200, {"internal_id": 1})
 
     product_repo._get("/product/by-id/1")
 
     # Verify URL is constructed correctly
-    call_url = mock_requests_get.call_args[0][0]
-    assert "catalog-service.local" in call_url
+    call_url = fake_transport.requests[0].url
+    assert call_url.startswith("https://catalog-service.local")
     assert "/product/by-id/1" in call_url
 
 
-def test_get_returns_none_on_404(mock_requests_get, product_repo):
+def test_get_returns_none_on_404(fake_transport, product_repo):
     """Given resource not found (404), when _get is called, then returns None"""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_response.ok = False
-    mock_requests_get.return_value = mock_response
-
     result = product_repo._get("/product/by-id/999")
 
     assert result is None
 
 
-def test_get_raises_on_non_ok_status(mock_requests_get, product_repo):
+def test_get_raises_on_non_ok_status(fake_transport, product_repo):
     """Given non-OK status (500), when _get is called, then raises ValueError"""
-    mock_response = MagicMock()
-    mock_response.status_code = 500
-    mock_response.ok = False
-    mock_requests_get.return_value = mock_response
+    fake_transport.handlers[f"{CATALOG_URL}/product/by-id/1"] = (500, None)
 
     with pytest.raises(ValueError) as exc_info:
         product_repo._get("/product/by-id/1")
@@ -110,10 +143,10 @@ def test_get_raises_on_non_ok_status(mock_requests_get, product_repo):
     assert "returned 500" in str(exc_info.value)
 
 
-def test_get_raises_on_connection_error(mock_requests_get, product_repo):
+def test_get_raises_on_connection_error(fake_transport, product_repo):
     """Given connection error, when _get is called, then raises ValueError"""
-    mock_requests_get.side_effect = requests.exceptions.ConnectionError(
-        "Connection refused"
+    fake_transport.handlers[f"{CATALOG_URL}/product/by-id/1"] = (
+        requests.exceptions.ConnectionError("Connection refused")
     )
 
     with pytest.raises(ValueError) as exc_info:
@@ -122,9 +155,11 @@ def test_get_raises_on_connection_error(mock_requests_get, product_repo):
     assert "Failed to reach catalog service" in str(exc_info.value)
 
 
-def test_get_raises_on_timeout(mock_requests_get, product_repo):
+def test_get_raises_on_timeout(fake_transport, product_repo):
     """Given request timeout, when _get is called, then raises ValueError"""
-    mock_requests_get.side_effect = requests.exceptions.Timeout("Request timed out")
+    fake_transport.handlers[f"{CATALOG_URL}/product/by-id/1"] = (
+        requests.exceptions.Timeout("Request timed out")
+    )
 
     with pytest.raises(ValueError) as exc_info:
         product_repo._get("/product/by-id/1")
@@ -132,128 +167,132 @@ def test_get_raises_on_timeout(mock_requests_get, product_repo):
     assert "Failed to reach catalog service" in str(exc_info.value)
 
 
-def test_get_success_returns_json(mock_requests_get, product_repo):
+def test_get_success_returns_json(fake_transport, product_repo):
     """Given successful response, when _get is called, then returns JSON data"""
-    mock_response = MagicMock()
-    mock_response.ok = True
-    mock_response.json.return_value = {"internal_id": 1, "name": "Test Product"}
-    mock_requests_get.return_value = mock_response
+    fake_transport.handlers[f"{CATALOG_URL}/product/by-id/1"] = (
+        200,
+        {"internal_id": 1, "name": "Test Product"},
+    )
 
     result = product_repo._get("/product/by-id/1")
 
     assert result == {"internal_id": 1, "name": "Test Product"}
 
 
-def test_find_by_id_found(mock_requests_get, product_repo):
+def test_find_by_id_found(fake_transport, product_repo):
     """Given product exists, when find_by_id is called, then returns Product entity"""
-    from src.entities.product import ProductCategory
-    from src.entities.value_objects.name import Name
-    from src.entities.value_objects.money import Money
-    from src.entities.value_objects.sku import SKU
-
-    # Mock product response
-    product_response = MagicMock()
-    product_response.ok = True
-    product_response.json.return_value = {
-        "name": Name.create("Test Product"),
-        "price": Money(10.0),
-        "is_active": True,
-        "default_ingredient": [{"ingredient_internal_id": 1, "quantity": 1}],
-        "category": ProductCategory.BURGER,
-        "sku": SKU.create("P-1234-ABC"),
-        "internal_id": 1,
-    }
-
-    # Mock ingredient response for the default_ingredient lookup
-    ingredient_response = MagicMock()
-    ingredient_response.ok = True
-    ingredient_response.json.return_value = {
-        "name": "Cheese",
-        "price": {"amount": 1.0},
-        "is_active": True,
-        "type": "cheese",
-        "applies_to_burger": True,
-        "applies_to_side": False,
-        "applies_to_drink": False,
-        "applies_to_dessert": False,
-        "internal_id": 1,
-    }
-
-    # Set up mock to return different responses for product and ingredient calls
-    mock_requests_get.side_effect = [product_response, ingredient_response]
+    fake_transport.handlers[PRODUCT_URL.format(1, "false")] = (200, make_product_payload())
+    fake_transport.handlers[INGREDIENT_URL] = (200, make_ingredient_payload())
 
     result = product_repo.find_by_id(1, include_inactive=False)
 
     assert result is not None
     assert result.internal_id == 1
-    assert len(mock_requests_get.call_args_list) == 2  # Product + ingredient
+    assert result.category is ProductCategory.BURGER
+    assert len(fake_transport.requests) == 2  # Product + ingredient
 
     # Verify include_inactive parameter is passed
-    product_call_url = mock_requests_get.call_args_list[0][0][0]
+    product_call_url = fake_transport.requests[0].url
     assert "include_inactive=false" in product_call_url
 
 
-def test_find_by_id_not_found(mock_requests_get, product_repo):
+def test_find_by_id_not_found(fake_transport, product_repo):
     """Given product does not exist (404), when find_by_id is called, then returns None"""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_response.ok = False
-    mock_requests_get.return_value = mock_response
-
     result = product_repo.find_by_id(999)
 
     assert result is None
 
 
-def test_find_by_id_with_include_inactive(mock_requests_get, product_repo):
+def test_find_by_id_with_include_inactive(fake_transport, product_repo):
     """Given include_inactive=True, when find_by_id is called, then passes parameter correctly"""
-    from src.entities.product import ProductCategory
-    from src.entities.value_objects.name import Name
-    from src.entities.value_objects.money import Money
-    from src.entities.value_objects.sku import SKU
-
-    # Mock product response
-    product_response = MagicMock()
-    product_response.ok = True
-    product_response.json.return_value = {
-        "name": Name.create("Inactive Product"),
-        "price": Money(5.0),
-        "is_active": False,
-        "default_ingredient": [{"ingredient_internal_id": 1, "quantity": 1}],
-        "category": ProductCategory.SIDE,
-        "sku": SKU.create("P-5678-XYZ"),
-        "internal_id": 2,
-    }
-
-    # Mock ingredient response
-    ingredient_response = MagicMock()
-    ingredient_response.ok = True
-    ingredient_response.json.return_value = {
-        "name": "Lettuce",
-        "price": {"amount": 0.5},
-        "is_active": True,
-        "type": "vegetable",
-        "applies_to_burger": False,
-        "applies_to_side": True,
-        "applies_to_drink": False,
-        "applies_to_dessert": False,
-        "internal_id": 1,
-    }
-
-    mock_requests_get.side_effect = [product_response, ingredient_response]
+    fake_transport.handlers[PRODUCT_URL.format(2, "true")] = (
+        200,
+        make_product_payload(internal_id=2, is_active=False, category="side"),
+    )
+    fake_transport.handlers[INGREDIENT_URL] = (200, make_ingredient_payload("vegetable"))
 
     result = product_repo.find_by_id(2, include_inactive=True)
 
     assert result is not None
+    assert result.category is ProductCategory.SIDE
     # Verify include_inactive=true is in URL
-    product_call_url = mock_requests_get.call_args_list[0][0][0]
+    product_call_url = fake_transport.requests[0].url
     assert "include_inactive=true" in product_call_url
 
 
-def test_find_by_id_connection_error(mock_requests_get, product_repo):
+def test_find_by_id_returns_cached_product(fake_transport, product_repo):
+    """Given a product was already fetched, when find_by_id is called again, then no new request is made"""
+    fake_transport.handlers[PRODUCT_URL.format(1, "false")] = (200, make_product_payload())
+    fake_transport.handlers[INGREDIENT_URL] = (200, make_ingredient_payload())
+
+    first = product_repo.find_by_id(1)
+    second = product_repo.find_by_id(1)
+
+    assert second.internal_id == first.internal_id
+    assert len(fake_transport.requests) == 2  # Product + ingredient, once
+
+
+def test_find_by_id_returns_independent_copies(fake_transport, product_repo):
+    """Given a cached product, when a caller mutates its copy, then later reads are unaffected"""
+    fake_transport.handlers[PRODUCT_URL.format(1, "false")] = (200, make_product_payload())
+    fake_transport.handlers[INGREDIENT_URL] = (200, make_ingredient_payload())
+
+    first = product_repo.find_by_id(1)
+    first.is_active = False
+    first.default_ingredient.clear()
+    second = product_repo.find_by_id(1)
+
+    assert second is not first
+    assert second.is_active is True
+    assert len(second.default_ingredient) == 1
+
+
+def test_cache_is_shared_across_repositories(fake_transport, product_repo, mock_ssm_client):
+    """Given two repositories for the same catalog, when one invalidates a product, then both see it"""
+    other_repo = HTTPProductRepository(base_url=CATALOG_URL)
+    other_repo._session.mount("https://", fake_transport)
+
+    product_repo.find_by_id(999)
+    other_repo.find_by_id(999)
+    other_repo.invalidate(999)
+    product_repo.find_by_id(999)
+
+    assert len(fake_transport.requests) == 2
+
+
+def test_find_by_id_caches_not_found(fake_transport, product_repo):
+    """Given product does not exist, when find_by_id is called twice, then the 404 is served from cache"""
+    assert product_repo.find_by_id(999) is None
+    assert product_repo.find_by_id(999) is None
+    assert len(fake_transport.requests) == 1
+
+
+def test_find_by_id_cache_expires(fake_transport, mock_ssm_client):
+    """Given a zero TTL, when find_by_id is called twice, then the catalog is queried each time"""
+    repo = HTTPProductRepository(base_url=CATALOG_URL, not_found_ttl=0)
+    repo._session.mount("https://", fake_transport)
+
+    repo.find_by_id(999)
+    repo.find_by_id(999)
+
+    assert len(fake_transport.requests) == 2
+
+
+def test_invalidate_drops_cached_lookups(fake_transport, product_repo):
+    """Given a cached lookup, when invalidate is called, then the next find_by_id hits the catalog"""
+    product_repo.find_by_id(999)
+    product_repo.find_by_id(999, include_inactive=True)
+    product_repo.invalidate(999)
+    product_repo.find_by_id(999)
+
+    assert len(product_repo._cache) == 1
+    assert len(fake_transport.requests) == 3
+
+
+def test_find_by_id_connection_error(fake_transport, product_repo):
     """Given network error, when find_by_id is called, then raises ValueError"""
-    mock_requests_get.side_effect = requests.exceptions.RequestException(
-        "Network error"
+    fake_transport.handlers[PRODUCT_URL.format(1, "false")] = (
+        requests.exceptions.RequestException("Network error")
     )
 
     with pytest.raises(ValueError) as exc_info:
@@ -262,12 +301,9 @@ def test_find_by_id_connection_error(mock_requests_get, product_repo):
     assert "Failed to reach catalog service" in str(exc_info.value)
 
 
-def test_find_by_id_server_error(mock_requests_get, product_repo):
+def test_find_by_id_server_error(fake_transport, product_repo):
     """Given server error (500), when find_by_id is called, then raises ValueError"""
-    mock_response = MagicMock()
-    mock_response.status_code = 500
-    mock_response.ok = False
-    mock_requests_get.return_value = mock_response
+    fake_transport.handlers[PRODUCT_URL.format(1, "false")] = (500, None)
 
     with pytest.raises(ValueError) as exc_info:
         product_repo.find_by_id(1)
@@ -275,42 +311,14 @@ def test_find_by_id_server_error(mock_requests_get, product_repo):
     assert "returned 500" in str(exc_info.value)
 
 
-def test_save_not_implemented(product_repo):
+def test_save_not_implemented(product_repo, dummy_burger_product):
     """Given save is called, when method is invoked, then raises NotImplementedError"""
-    from src.entities.value_objects.name import Name
-    from src.entities.value_objects.money import Money
-    from src.entities.value_objects.sku import SKU
-    from src.entities.product import ProductCategory, ProductReceiptItem
-    from src.entities.ingredient import Ingredient, IngredientType
-
-    ingredient = Ingredient(
-        name=Name.create("Cheese"),
-        price=Money(1.0),
-        is_active=True,
-        type=IngredientType.CHEESE,
-        applies_to_burger=True,
-        applies_to_side=False,
-        applies_to_drink=False,
-        applies_to_dessert=False,
-    )
-
-    product = Product(
-        name=Name.create("Test"),
-        price=Money(10.0),
-        is_active=True,
-        default_ingredient=[ProductReceiptItem(ingredient, 1)],
-        category=ProductCategory.BURGER,
-        sku=SKU.create("P-1234-ABC"),
-    )
-
     with pytest.raises(NotImplementedError):
-        product_repo.save(product)
+        product_repo.save(dummy_burger_product)
 
 
 def test_find_by_sku_not_implemented(product_repo):
     """Given find_by_sku is called, when method is invoked, then raises NotImplementedError"""
-    from src.entities.value_objects.sku import SKU
-
     with pytest.raises(NotImplementedError):
         product_repo.find_by_sku(SKU.create("P-1234-ABC"))
 
@@ -329,8 +337,6 @@ def test_delete_not_implemented(product_repo):
 
 def test_exists_by_sku_not_implemented(product_repo):
     """Given exists_by_sku is called, when method is invoked, then raises NotImplementedError"""
-    from src.entities.value_objects.sku import SKU
-
     with pytest.raises(NotImplementedError):
         product_repo.exists_by_sku(SKU.create("P-1234-ABC"))
 
@@ -349,7 +355,6 @@ def test_exists_by_name_not_implemented(product_repo):
 
 def test_exists_by_category_not_implemented(product_repo):
     """Given exists_by_category is called, when method is invoked, then raises NotImplementedError"""
-    from src.entities.product import ProductCategory
-
     with pytest.raises(NotImplementedError):
         product_repo.exists_by_category(ProductCategory.BURGER)
+
@@ -1,13 +1,11 @@
 import pytest
 from src.entities.ingredient import Ingredient, IngredientType
-from src.entities.value_objects.money import Money
-from src.entities.value_objects.name import Name
 
 
-def test_ingredient_str_repr():
+def test_ingredient_str_repr(name_queijo, money_1):
     ing = Ingredient(
-        name=Name.create("Queijo"),
-        price=Money(amount=1.0),
+        name=name_queijo,
+        price=money_1,
         is_active=True,
         type=IngredientType.CHEESE,
         applies_to_burger=True,
@@ -22,11 +20,11 @@ def test_ingredient_str_repr():
     assert "Ingredient" in r
 
 
-def test_ingredient_invalid_type():
+def test_ingredient_invalid_type(name_queijo, money_1):
     with pytest.raises(ValueError):
         Ingredient(
-            name=Name.create("Queijo"),
-            price=Money(amount=1.0),
+            name=name_queijo,
+            price=money_1,
             is_active=True,
             type=None,
             applies_to_burger=True,
@@ -37,11 +35,11 @@ def test_ingredient_invalid_type():
         )
 
 
-def test_ingredient_invalid_usage():
+def test_ingredient_invalid_usage(name_queijo, money_1):
     with pytest.raises(ValueError):
         Ingredient(
-            name=Name.create("Queijo"),
-            price=Money(amount=1.0),
+            name=name_queijo,
+            price=money_1,
             is_active=True,
             type=IngredientType.CHEESE,
             applies_to_burger=False,
@@ -4,6 +4,8 @@ from src.adapters.controllers.order_controller import OrderController
 from src.application.repositories.order_repository import OrderRepository
 from src.adapters.presenters.interfaces.presenter_interface import PresenterInterface
 from src.entities.product import ProductCategory
+from src.entities.ingredient import IngredientType
+from src.entities.value_objects.money import Money
 from datetime import datetime
 
 
@@ -48,58 +50,56 @@ class DummyOrderRepository(OrderRepository):
         return {"status": "PAID"}
 
 
+def fake_catalog(path):
+    """Stand-in for the catalog service used by the create use case"""
+    if "/customer/" in path:
+        return {
+            "is_active": True,
+            "is_anonymous": False,
+            "email": "a@a.com",
+            "document": "123",
+            "internal_id": 1,
+            "name": "Test",
+        }
+    elif "/product/" in path:
+        return {
+            "is_active": True,
+            "internal_id": 1,
+            "name": "Test",
+            "price": Money(amount=10.0),
+            "default_ingredient": [{"ingredient_internal_id": 1, "quantity": 1}],
+            "category": ProductCategory.BURGER,
+            "sku": "ABC-1234-XYZ",
+        }
+    else:  # ingredient
+        return {
+            "name": "Queijo",
+            "price": Money(amount=1.0),
+            "is_active": True,
+            "type": IngredientType.CHEESE,
+            "applies_to_burger": True,
+            "applies_to_side": False,
+            "applies_to_drink": False,
+            "applies_to_dessert": False,
+            "internal_id": 1,
+        }
+
+
 def make_controller():
     repo = DummyOrderRepository()
     presenter = DummyPresenter()
     controller = OrderController(order_repository=repo, presenter=presenter)
-    # Mock _fetch_catalog para evitar dependência de env
-    for use_case in [controller.create_use_case]:
-        if hasattr(use_case, "_fetch_catalog"):
-
-            def fake_catalog(path):
-                if "/customer/" in path:
-                    return {
-                        "is_active": True,
-                        "is_anonymous": False,
-                        "email": "a@a.com",
-                        "document": "123",
-                        "internal_id": 1,
-                        "name": "Test",
-                    }
-                elif "/product/" in path:
-                    from src.entities.value_objects.money import Money
-
-                    return {
-                        "is_active": True,
-                        "internal_id": 1,
-                        "name": "Test",
-                        "price": Money(amount=10.0),
-                        "default_ingredient": [{"ingredient_internal_id": 1, "quantity": 1}],
-                        "category": ProductCategory.BURGER,
-                        "sku": "ABC-1234-XYZ",
-                    }
-                else:  # ingredient
-                    from src.entities.ingredient import IngredientType
-                    from src.entities.value_objects.money import Money
-
-                    return {
-                        "name": "Queijo",
-                        "price": Money(amount=1.0),
-                        "is_active": True,
-                        "type": IngredientType.CHEESE,
-                        "applies_to_burger": True,
-                        "applies_to_side": False,
-                        "applies_to_drink": False,
-                        "applies_to_dessert": False,
-                        "internal_id": 1,
-                    }
-
-            use_case._fetch_catalog = fake_catalog
+    # Mock _catalog_fetcher para evitar dependência de env
+    controller.create_use_case._catalog_fetcher = lambda: fake_catalog
     return controller
 
 
-def test_create_order_happy():
-    controller = make_controller()
+@pytest.fixture
+def controller():
+    return make_controller()
+
+
+def test_create_order_happy(controller):
     data = {"customer_internal_id": 1, "order_items": [{"product_internal_id": 1}]}
     resp = controller.create_order(data)
     # resp pode ser OrderResponse ou dict
@@ -109,8 +109,7 @@ def test_create_order_happy():
         assert resp["internal_id"] == 1
 
 
-def test_create_order_invalid(monkeypatch):
-    controller = make_controller()
+def test_create_order_invalid(controller, monkeypatch):
     monkeypatch.setattr(
         controller.create_use_case,
         "execute",
@@ -121,14 +120,12 @@ def test_create_order_invalid(monkeypatch):
         controller.create_order(data)
 
 
-def test_get_order_found():
-    controller = make_controller()
+def test_get_order_found(controller):
     resp = controller.get_order(1)
     assert resp is not None
 
 
-def test_update_order_status():
-    controller = make_controller()
+def test_update_order_status(controller):
     resp = controller.update_order_status(1, "PRONTO")
     if hasattr(resp, "status"):
         assert resp.status == "PRONTO"
@@ -136,20 +133,17 @@ def test_update_order_status():
         assert resp["status"] == "PRONTO"
 
 
-def test_cancel_order():
-    controller = make_controller()
+def test_cancel_order(controller):
     resp = controller.cancel_order(1)
     assert resp["message"] == "Order canceled successfully"
 
 
-def test_list_orders():
-    controller = make_controller()
+def test_list_orders(controller):
     resp = controller.list_orders()
     assert isinstance(resp, list) or isinstance(resp, dict) or hasattr(resp, "orders")
 
 
-def test_process_payment():
-    controller = make_controller()
+def test_process_payment(controller):
     data = {
         "transaction_id": "t",
         "approval_status": True,
@@ -163,21 +157,21 @@ def test_process_payment():
         assert resp["internal_id"] == 1
 
 
-def test_get_payment_status():
-    controller = make_controller()
+def test_get_payment_status(controller):
     resp = controller.get_payment_status(1)
     assert resp is not None
 
 
-def test_request_payment(monkeypatch):
-    controller = make_controller()
-    controller.payment_request_use_case = MagicMock()
-    controller.payment_request_use_case.execute.return_value = {"transaction_id": "t"}
+def test_request_payment(controller, monkeypatch):
+    payment_request_use_case = MagicMock()
+    payment_request_use_case.execute.return_value = {"transaction_id": "t"}
+    monkeypatch.setattr(
+        controller, "payment_request_use_case", payment_request_use_case
+    )
     resp = controller.request_payment(1)
     assert resp["transaction_id"] == "t"
 
 
-def test_get_orders_by_status():
-    controller = make_controller()
+def test_get_orders_by_status(controller):
     resp = controller.get_orders_by_status("RECEBIDO")
     assert isinstance(resp, list)
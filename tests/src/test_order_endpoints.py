@@ -1,12 +1,54 @@
 import pytest
 
+CATALOG_URL_PARAMETER = "/ordering-system/catalog/apigateway/url"
+PAYMENT_URL_PARAMETER = "/ordering-system/payment/apigateway/url"
 
-@pytest.fixture(scope="module")
-def test_client(mock_boto3_ssm):
-    """Create test client - imports app AFTER boto3 mock is active"""
-    from fastapi.testclient import TestClient
-    from src.main import app
-    return TestClient(app)
+
+class SSMStub:
+    """get_ssm_client() stand-in answering from a parameter name -> value dict"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get_parameter(self, parameter_name, decrypt=True):
+        return self.values.get(parameter_name)
+
+
+@pytest.fixture
+def ssm_stub(mock_boto3_ssm, monkeypatch):
+    """Cached SSM client replaced by a stub holding the catalog and payment hosts"""
+    from src.config import aws_ssm
+
+    stub = SSMStub(
+        {
+            CATALOG_URL_PARAMETER: "https://catalog.local",
+            PAYMENT_URL_PARAMETER: "https://payment.local",
+        }
+    )
+    monkeypatch.setattr(aws_ssm, "_ssm_client", stub)
+    monkeypatch.delenv("CATALOG_API_HOST", raising=False)
+    monkeypatch.delenv("PAYMENT_API_HOST", raising=False)
+    return stub
+
+
+@pytest.fixture
+def shared_container(ssm_stub, monkeypatch):
+    """The process-wide container on an in-memory database, emptied before and after"""
+    # Imported here so src.config.database is first loaded with SSM mocked
+    from src.adapters.di.container import container
+
+    container.close()
+    monkeypatch.setattr(container, "database_url", "sqlite:///:memory:")
+    yield container
+    container.close()
+
+
+@pytest.fixture
+def get_order_controller(shared_container):
+    """The route dependency that resolves controllers from the shared container"""
+    from src.adapters.routes.order_routes import get_order_controller
+
+    return get_order_controller
 
 
 def test_create_order_endpoint_invalid(test_client):
@@ -23,3 +65,79 @@ def test_get_order_not_found(test_client):
 def test_cancel_order_not_found(test_client):
     resp = test_client.delete("/order/cancel/9999")
     assert resp.status_code in (401, 404, 400, 500)
+
+
+def test_controllers_share_catalog_session(get_order_controller):
+    first = get_order_controller()
+    second = get_order_controller()
+
+    product_repository = first.order_repository.product_repository
+    assert product_repository is second.order_repository.product_repository
+    assert (
+        product_repository._session
+        is second.order_repository.product_repository._session
+    )
+
+
+def test_container_close_releases_catalog_session(shared_container, monkeypatch):
+    session = shared_container.product_repository._session
+    closed = []
+    monkeypatch.setattr(session, "close", lambda: closed.append(True))
+
+    shared_container.close()
+
+    assert closed == [True]
+    assert shared_container._product_repository is None
+
+
+def test_controllers_share_catalog_executor(get_order_controller):
+    first = get_order_controller()
+    second = get_order_controller()
+
+    assert (
+        first.create_use_case.catalog_executor
+        is second.create_use_case.catalog_executor
+    )
+
+
+def test_container_close_shuts_down_catalog_executor(shared_container):
+    executor = shared_container.catalog_executor
+
+    shared_container.close()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+    assert shared_container.catalog_executor is not executor
+
+
+def test_controllers_share_database_engine(get_order_controller):
+    first = get_order_controller()
+    second = get_order_controller()
+
+    assert first.order_repository.database is second.order_repository.database
+
+
+def test_container_close_disposes_database(shared_container, monkeypatch):
+    database = shared_container.database
+    disposed = []
+    monkeypatch.setattr(database, "dispose", lambda: disposed.append(True))
+
+    shared_container.close()
+
+    assert disposed == [True]
+    assert shared_container._database is None
+
+
+def test_client_without_host_is_rebuilt(get_order_controller, ssm_stub):
+    """Given SSM had no catalog host at first use, when it recovers, then the next controller gets a configured client"""
+    catalog_url = ssm_stub.values.pop(CATALOG_URL_PARAMETER)
+    first = get_order_controller()
+    assert first.order_repository.product_repository.base_url is None
+
+    ssm_stub.values[CATALOG_URL_PARAMETER] = catalog_url
+    second = get_order_controller()
+
+    product_repository = second.order_repository.product_repository
+    assert product_repository.base_url == catalog_url
+    assert second.payment_request_use_case.order_repository is second.order_repository
+    assert get_order_controller().order_repository.product_repository is product_repository
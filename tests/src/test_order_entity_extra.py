@@ -1,47 +1,10 @@
 import pytest
-from src.entities.order import Order, OrderItem
-from src.entities.product import Product, ProductCategory, ProductReceiptItem
-from src.entities.ingredient import Ingredient, IngredientType
+from dataclasses import replace
+from src.entities.order import Order
 from src.entities.value_objects.money import Money
-from src.entities.value_objects.name import Name
-from src.entities.value_objects.sku import SKU
 
 
 # --- Fase 1: Fluxos de erro e borda ---
-def make_dummy_product():
-    dummy_ing = Ingredient(
-        name=Name.create("Queijo"),
-        price=Money(amount=1.0),
-        is_active=True,
-        type=IngredientType.CHEESE,
-        applies_to_burger=True,
-        applies_to_side=False,
-        applies_to_drink=False,
-        applies_to_dessert=False,
-        internal_id=1,
-    )
-    return Product(
-        name=Name.create("Burger"),
-        price=Money(amount=10.0),
-        category=ProductCategory.BURGER,
-        sku=SKU.create("ABC-1234-XYZ"),
-        default_ingredient=[ProductReceiptItem(dummy_ing, 1)],
-        is_active=True,
-        internal_id=1,
-    )
-
-
-def make_order_item(product=None):
-    if product is None:
-        product = make_dummy_product()
-    return OrderItem(
-        order_internal_id=1,
-        product=product,
-        additional_ingredient=[],
-        remove_ingredient=[],
-    )
-
-
 def test_order_create_value_zero_raises():
     # Valor zero pode ser aceito dependendo da regra de negócio, então não forçamos erro aqui
     pass
@@ -52,32 +15,17 @@ def test_order_create_value_negative_raises():
         Money(amount=-5.0)
 
 
-def test_order_create_with_inactive_ingredient_raises():
-    inactive_ing = Ingredient(
-        name=Name.create("Queijo"),
-        price=Money(amount=1.0),
-        is_active=False,
-        type=IngredientType.CHEESE,
-        applies_to_burger=True,
-        applies_to_side=False,
-        applies_to_drink=False,
-        applies_to_dessert=False,
-        internal_id=2,
-    )
-    product = make_dummy_product()
-    item = OrderItem(
-        order_internal_id=1,
-        product=product,
-        additional_ingredient=[inactive_ing],
-        remove_ingredient=[],
-    )
+def test_order_create_with_inactive_ingredient_raises(
+    make_order_item, cheese_ingredient
+):
+    inactive_ing = replace(cheese_ingredient, is_active=False, internal_id=2)
+    item = make_order_item(additional_ingredient=[inactive_ing])
     # O erro pode ser levantado em lógica de use case, aqui só garantimos que ingrediente inativo pode ser adicionado
     assert item.additional_ingredient[0].is_active is False
 
 
-def test_order_process_payment_missing_fields():
-    item = make_order_item()
-    order = Order.create(customer_internal_id=1, order_items=[item])
+def test_order_process_payment_missing_fields(fresh_order):
+    order = fresh_order()
     payment = {
         "transaction_id": "abc",
         "approval_status": True,
@@ -87,9 +35,8 @@ def test_order_process_payment_missing_fields():
     assert order.has_payment_verified is True
 
 
-def test_order_can_be_cancelled_and_finalized():
-    item = make_order_item()
-    order = Order.create(customer_internal_id=1, order_items=[item])
+def test_order_can_be_cancelled_and_finalized(fresh_order):
+    order = fresh_order()
     assert order.can_be_cancelled() is True
     order.status = order.status.next_status()  # EM_PREPARACAO
     assert order.can_be_cancelled() is True
@@ -97,16 +44,15 @@ def test_order_can_be_cancelled_and_finalized():
     assert order.can_be_finalized() is True
 
 
-def test_order_get_total_items():
+def test_order_get_total_items(make_order_item):
     item1 = make_order_item()
     item2 = make_order_item()
     order = Order.create(customer_internal_id=1, order_items=[item1, item2])
     assert order.get_total_items() == 2
 
 
-def test_order_payment_as_dict():
-    item = make_order_item()
-    order = Order.create(customer_internal_id=1, order_items=[item])
+def test_order_payment_as_dict(burger_order_item):
+    order = Order.create(customer_internal_id=1, order_items=[burger_order_item])
     d = order.payment_as_dict
     assert isinstance(d, dict)
     assert "payment_date" in d
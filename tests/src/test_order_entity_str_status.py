@@ -1,66 +1,42 @@
-from src.entities.order import Order, OrderItem
-from src.entities.product import Product, ProductCategory, ProductReceiptItem
-from src.entities.ingredient import Ingredient, IngredientType
-from src.entities.value_objects.money import Money
-from src.entities.value_objects.name import Name
-from src.entities.value_objects.sku import SKU
-
-
-def make_dummy_product():
-    dummy_ing = Ingredient(
-        name=Name.create("Queijo"),
-        price=Money(amount=1.0),
-        is_active=True,
-        type=IngredientType.CHEESE,
-        applies_to_burger=True,
-        applies_to_side=False,
-        applies_to_drink=False,
-        applies_to_dessert=False,
-        internal_id=1,
-    )
-    return Product(
-        name=Name.create("Burger"),
-        price=Money(amount=10.0),
-        category=ProductCategory.BURGER,
-        sku=SKU.create("ABC-1234-XYZ"),
-        default_ingredient=[ProductReceiptItem(dummy_ing, 1)],
-        is_active=True,
-        internal_id=1,
-    )
+import pytest
 
-
-def test_order_str_repr():
-    item = OrderItem(
-        order_internal_id=1,
-        product=make_dummy_product(),
-        additional_ingredient=[],
-        remove_ingredient=[],
-    )
-    order = Order.create(customer_internal_id=1, order_items=[item])
-    s = str(order)
-    r = repr(order)
-    assert "Order" in s
-    assert "Order" in r
-
-
-def test_order_update_display_id():
-    item = OrderItem(
-        order_internal_id=1,
-        product=make_dummy_product(),
-        additional_ingredient=[],
-        remove_ingredient=[],
+from src.entities.order import Order, OrderItem
+from src.entities.value_objects.order_status import OrderStatus
+
+
+@pytest.mark.parametrize(
+    "obj_fixture,name",
+    [
+        ("burger_order", "Order"),
+        ("burger_order_item", "OrderItem"),
+        ("dummy_product", "Product"),
+    ],
+)
+def test_str_repr(request, obj_fixture, name):
+    obj = request.getfixturevalue(obj_fixture)
+    assert name in str(obj)
+    assert name in repr(obj)
+
+
+def test_order_update_display_id(burger_order_item, money_10):
+    order = Order(
+        customer_internal_id=1,
+        order_items=[burger_order_item],
+        value=money_10,
+        status=OrderStatus.create("RECEBIDO"),
+        internal_id=42,
+        _skip_active_validation=True,
     )
-    order = Order.create(customer_internal_id=1, order_items=[item], internal_id=42)
     order.order_display_id = ""
     display_id = order.update_display_id()
     assert display_id == "042"
     assert order.order_display_id == "042"
 
 
-def test_order_next_status_and_previous_status():
+def test_order_next_status_and_previous_status(dummy_product):
     item = OrderItem(
         order_internal_id=1,
-        product=make_dummy_product(),
+        product=dummy_product,
         additional_ingredient=[],
         remove_ingredient=[],
     )
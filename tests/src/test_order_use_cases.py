@@ -1,5 +1,11 @@
 import pytest
-from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Callable, Optional
+from types import SimpleNamespace
+from unittest.mock import Mock
+from src.application.use_cases import order_use_cases
 from src.application.use_cases.order_use_cases import (
     OrderCreateUseCase,
     OrderReadUseCase,
@@ -11,128 +17,129 @@ from src.application.use_cases.order_use_cases import (
     OrderPaymentRequestUseCase,
     OrderByStatusUseCase,
 )
+from src.adapters.gateways.http_payment_client import HTTPPaymentClient
 from src.application.dto.implementation.order_dto import (
     OrderCreateRequest,
     OrderItemRequest,
     OrderUpdateRequest,
     PaymentRequest,
 )
-from src.entities.order import Order, OrderItem
-from src.entities.product import Product
-from src.entities.ingredient import Ingredient
+from src.entities.order import Order
 from src.entities.value_objects.money import Money
 from datetime import datetime
 
-from src.entities.value_objects.name import Name
-from src.entities.value_objects.sku import SKU
-from src.entities.product import ProductCategory, ProductReceiptItem
+from src.entities.product import ProductCategory
 from src.entities.ingredient import IngredientType
 
 
-class DummyIngredient(Ingredient):
-    def __init__(
-        self, internal_id=1, name="Ing", price=Money(amount=1.0), is_active=True
-    ):
-        super().__init__(
-            name=Name.create(name),
-            price=price,
-            is_active=is_active,
-            type=IngredientType.CHEESE,
-            applies_to_burger=True,
-            applies_to_side=False,
-            applies_to_drink=False,
-            applies_to_dessert=False,
-            internal_id=internal_id,
-        )
-
-
-class DummyProduct(Product):
-    def __init__(
-        self,
-        internal_id=1,
-        name="Test",
-        price=Money(amount=10.0),
-        is_active=True,
-        default_ingredient=None,
-        category=ProductCategory.BURGER,
-        sku=None,
-    ):
-        if default_ingredient is None:
-            dummy_ing = DummyIngredient()
-            default_ingredient = [ProductReceiptItem(dummy_ing, 1)]
-        if sku is None:
-            sku = SKU.create("ABC-1234-XYZ")
-        super().__init__(
-            name=Name.create(name),
-            price=price,
-            category=category,
-            sku=sku,
-            default_ingredient=default_ingredient,
-            is_active=is_active,
-            internal_id=internal_id,
-        )
-
-
-def make_order_item(product=None, additional=None, remove=None):
-    if product is None:
-        product = DummyProduct()
-    if additional is None:
-        additional = []
-    if remove is None:
-        remove = []
-    return OrderItem(
-        order_internal_id=1,
-        product=product,
-        additional_ingredient=additional,
-        remove_ingredient=remove,
-    )
-
-
-def make_order():
-    item = make_order_item()
-    return Order.create(customer_internal_id=1, order_items=[item])
-
-
-def test_order_read_use_case():
-    repo = MagicMock()
-    order = make_order()
-    repo.get_by_id.return_value = order
+@dataclass
+class RepoStub:
+    """OrderRepository stand-in; each test assigns only the methods it needs"""
+
+    create: Optional[Callable] = None
+    get_by_id: Optional[Callable] = None
+    get_by_status: Optional[Callable] = None
+    list_all: Optional[Callable] = None
+    update: Optional[Callable] = None
+    cancel: Optional[Callable] = None
+    update_status: Optional[Callable] = None
+    process_payment: Optional[Callable] = None
+    get_payment_status: Optional[Callable] = None
+
+
+@pytest.fixture
+def repo():
+    return RepoStub()
+
+
+@pytest.fixture(scope="module")
+def _payment_client_mock():
+    return Mock(spec_set=HTTPPaymentClient)
+
+
+@pytest.fixture
+def payment_client(_payment_client_mock):
+    """Module-wide payment client mock, reset before each test"""
+    _payment_client_mock.reset_mock(return_value=True, side_effect=True)
+    return _payment_client_mock
+
+
+_CUSTOMER = {
+    "is_active": True,
+    "is_anonymous": False,
+    "email": "a@a.com",
+    "document": "123",
+    "internal_id": 1,
+    "name": "Test",
+}
+
+_PRODUCT = {
+    "is_active": True,
+    "internal_id": 1,
+    "name": "Test",
+    "price": Money(amount=10.0),
+    "default_ingredient": [{"ingredient_internal_id": 1, "quantity": 1}],
+    "category": ProductCategory.BURGER,
+    "sku": "ABC-1234-XYZ",
+}
+
+_INGREDIENT = {
+    "name": "Queijo",
+    "price": Money(amount=1.0),
+    "is_active": True,
+    "type": IngredientType.CHEESE,
+    "applies_to_burger": True,
+    "applies_to_side": False,
+    "applies_to_drink": False,
+    "applies_to_dessert": False,
+    "internal_id": 1,
+}
+
+
+def _fake_catalog(path):
+    """Valid customer/product/ingredient catalog; the use case copies what it mutates"""
+    if "/customer/" in path:
+        return _CUSTOMER
+    if "/product/" in path:
+        return _PRODUCT
+    return _INGREDIENT
+
+
+def test_order_read_use_case(repo, burger_order):
+    order = burger_order
+    repo.get_by_id = lambda order_internal_id: order
     use_case = OrderReadUseCase(repo)
     resp = use_case.execute(order.internal_id)
     assert resp.internal_id == order.internal_id
 
 
-def test_order_update_use_case_status():
-    repo = MagicMock()
-    order = make_order()
-    repo.get_by_id.return_value = order
-    repo.update.return_value = order
+def test_order_update_use_case_status(repo, fresh_order):
+    order = fresh_order()
+    repo.get_by_id = lambda order_internal_id: order
+    repo.update = lambda updated: updated
     use_case = OrderUpdateUseCase(repo)
     req = OrderUpdateRequest(status="PRONTO")
     resp = use_case.execute(order.internal_id, req)
     assert resp.status == "PRONTO"
 
 
-def test_order_cancel_use_case():
-    repo = MagicMock()
-    repo.cancel.return_value = True
+def test_order_cancel_use_case(repo):
+    repo.cancel = lambda order_internal_id: True
     use_case = OrderCancelUseCase(repo)
     assert use_case.execute(1) is True
 
 
-def test_order_status_update_use_case():
-    repo = MagicMock()
-    order = make_order()
-    repo.update_status.return_value = order
+def test_order_status_update_use_case(repo, burger_order):
+    order = burger_order
+    repo.update_status = lambda order_internal_id, status: order
     use_case = OrderStatusUpdateUseCase(repo)
     resp = use_case.execute(order.internal_id, "PRONTO")
     assert resp.internal_id == order.internal_id
 
 
-def test_order_payment_process_use_case():
-    repo = MagicMock()
-    order = make_order()
-    repo.process_payment.return_value = order
+def test_order_payment_process_use_case(repo, burger_order):
+    order = burger_order
+    repo.process_payment = lambda order_internal_id, payment_data: order
     use_case = OrderPaymentProcessUseCase(repo)
     req = PaymentRequest(
         transaction_id="t", approval_status=True, date=datetime.now(), message="ok"
@@ -141,21 +148,25 @@ def test_order_payment_process_use_case():
     assert resp.internal_id == order.internal_id
 
 
-def test_order_payment_status_use_case():
-    repo = MagicMock()
-    order = make_order()
-    repo.get_by_id.return_value = order
+def test_order_payment_status_use_case(repo, burger_order):
+    order = burger_order
+    repo.get_by_id = lambda order_internal_id: order
     use_case = OrderPaymentStatusUseCase(repo)
     resp = use_case.execute(order.internal_id)
     assert resp.order_internal_id == order.internal_id
 
 
-def test_order_payment_request_use_case_happy():
-    repo = MagicMock()
-    order = make_order()
-    order.has_payment_verified = False
-    repo.get_by_id.return_value = order
-    payment_client = MagicMock()
+@pytest.mark.parametrize(
+    "paid,expect_raises",
+    [(False, None), (True, ValueError)],
+    ids=["happy", "already_paid"],
+)
+def test_order_payment_request_use_case(
+    repo, fresh_order, payment_client, paid, expect_raises
+):
+    order = fresh_order()
+    order.has_payment_verified = paid
+    repo.get_by_id = lambda order_internal_id: order
     payment_client.request_payment.return_value = {
         "transaction_id": "t",
         "payment_url": "url",
@@ -164,138 +175,272 @@ def test_order_payment_request_use_case_happy():
         "link": None,
     }
     use_case = OrderPaymentRequestUseCase(repo, payment_client)
-    resp = use_case.execute(order.internal_id)
-    assert resp.transaction_id == "t"
-    assert resp.payment_url == "url"
-
-
-def test_order_payment_request_use_case_already_paid():
-    repo = MagicMock()
-    order = make_order()
-    order.has_payment_verified = True
-    repo.get_by_id.return_value = order
-    payment_client = MagicMock()
-    use_case = OrderPaymentRequestUseCase(repo, payment_client)
-    with pytest.raises(ValueError):
-        use_case.execute(order.internal_id)
+    with pytest.raises(expect_raises) if expect_raises else nullcontext():
+        resp = use_case.execute(order.internal_id)
+    if not expect_raises:
+        assert resp.transaction_id == "t"
+        assert resp.payment_url == "url"
 
 
-def test_order_by_status_use_case():
-    repo = MagicMock()
-    order = make_order()
-    repo.get_by_status.return_value = [order]
+def test_order_by_status_use_case(repo, burger_order):
+    order = burger_order
+    repo.get_by_status = lambda status: [order]
     use_case = OrderByStatusUseCase(repo)
     resp = use_case.execute("RECEBIDO")
     assert len(resp) == 1
     assert resp[0].internal_id == order.internal_id
 
 
-def test_order_create_use_case_happy(monkeypatch):
-    repo = MagicMock()
-    use_case = OrderCreateUseCase(repo)
+_INACTIVE = {
+    "is_active": False,
+    "email": "a@a.com",
+    "document": "123",
+    "internal_id": 1,
+    "name": "Test",
+    "price": 10.0,
+    "default_ingredient": [],
+    "category": ProductCategory.BURGER,
+    "sku": "ABC-1234-XYZ",
+    "type": "cheese",
+    "applies_to_burger": True,
+    "applies_to_side": False,
+    "applies_to_drink": False,
+    "applies_to_dessert": False,
+    "quantity": 1,
+}
+
+
+def _inactive_catalog(path):
+    return _INACTIVE
+
+
+def _missing_catalog(path):
+    return None
+
+
+@pytest.fixture(scope="module")
+def catalog_executor():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+@pytest.fixture
+def create_use_case(repo, catalog_executor):
+    """OrderCreateUseCase wired to this test's repository stub and a worker pool"""
+    return OrderCreateUseCase(repo, catalog_executor=catalog_executor)
+
+
+@pytest.mark.parametrize(
+    "catalog,expect_raises",
+    [
+        (_fake_catalog, None),
+        (_inactive_catalog, ValueError),
+        (_missing_catalog, ValueError),
+    ],
+    ids=["happy", "inactive_customer", "missing_catalog"],
+)
+def test_order_create_use_case(
+    create_use_case, repo, monkeypatch, catalog, expect_raises
+):
+    monkeypatch.setattr(create_use_case, "_catalog_fetcher", lambda: catalog)
+    item_req = OrderItemRequest(
+        product_internal_id=1,
+        additional_ingredient_internal_ids=[],
+        remove_ingredient_internal_ids=[],
+    )
+    req = OrderCreateRequest(customer_internal_id=1, order_items=[item_req])
+
+    # Mock repo.create para retornar um Order real
+    def repo_create(order):
+        return Order.create(
+            customer_internal_id=order.customer_internal_id,
+            order_items=order.order_items,
+        )
+
+    repo.create = repo_create
+    with pytest.raises(expect_raises) if expect_raises else nullcontext():
+        resp = create_use_case.execute(req)
+    if not expect_raises:
+        assert resp.customer_internal_id == 1
+
+
+def test_order_create_use_case_fetches_each_resource_once(
+    create_use_case, repo, monkeypatch
+):
+    repo.create = lambda order: order
+    calls = []
 
-    # Patch _fetch_catalog to return valid customer/product/ingredient
     def fake_catalog(path):
+        calls.append(path)
         if "/customer/" in path:
             return {
                 "is_active": True,
-                "is_anonymous": False,
-                "email": "a@a.com",
-                "document": "123",
-                "internal_id": 1,
-                "name": "Test",
+                "is_anonymous": True,
+                "email": None,
+                "document": None,
             }
         elif "/product/" in path:
-            from src.entities.value_objects.money import Money
-
             return {
                 "is_active": True,
                 "internal_id": 1,
                 "name": "Test",
-                "price": Money(amount=10.0),
+                "price": 10.0,
                 "default_ingredient": [{"ingredient_internal_id": 1, "quantity": 1}],
                 "category": ProductCategory.BURGER,
                 "sku": "ABC-1234-XYZ",
             }
-        else:  # ingredient
-            from src.entities.ingredient import IngredientType
-            from src.entities.value_objects.money import Money
+        return {
+            "name": "Queijo",
+            "price": 1.0,
+            "is_active": True,
+            "type": "cheese",
+            "internal_id": 1,
+        }
 
-            return {
-                "name": "Queijo",
-                "price": Money(amount=1.0),
-                "is_active": True,
-                "type": IngredientType.CHEESE,
-                "applies_to_burger": True,
-                "applies_to_side": False,
-                "applies_to_drink": False,
-                "applies_to_dessert": False,
-                "internal_id": 1,
-            }
+    monkeypatch.setattr(create_use_case, "_catalog_fetcher", lambda: fake_catalog)
+    item_req = OrderItemRequest(
+        product_internal_id=1,
+        additional_ingredient_internal_ids=[1],
+        remove_ingredient_internal_ids=[],
+    )
+    req = OrderCreateRequest(customer_internal_id=1, order_items=[item_req] * 5)
 
-    monkeypatch.setattr(use_case, "_fetch_catalog", fake_catalog)
+    resp = create_use_case.execute(req)
+
+    assert len(resp.order_items) == 5
+    assert sorted(calls) == sorted(
+        [
+            "/customer/by-id/1?include_inactive=false",
+            "/product/by-id/1?include_inactive=false",
+            "/ingredient/by-id/1?include_inactive=false",
+        ]
+    )
+
+
+def test_order_create_use_case_resolves_catalog_settings_once(
+    create_use_case, repo, monkeypatch
+):
+    ssm_client = Mock()
+    ssm_client.get_parameter.return_value = None
+    monkeypatch.setattr(order_use_cases, "get_ssm_client", lambda: ssm_client)
+    monkeypatch.setenv("CATALOG_API_HOST", "https://catalog.local")
+    monkeypatch.setattr(
+        order_use_cases,
+        "get",
+        lambda url, **kwargs: SimpleNamespace(
+            ok=True, status_code=200, json=lambda: _fake_catalog(url)
+        ),
+    )
+    repo.create = lambda order: order
     item_req = OrderItemRequest(
         product_internal_id=1,
-        additional_ingredient_internal_ids=[],
+        additional_ingredient_internal_ids=[1],
         remove_ingredient_internal_ids=[],
     )
-    req = OrderCreateRequest(customer_internal_id=1, order_items=[item_req])
+    req = OrderCreateRequest(customer_internal_id=1, order_items=[item_req] * 5)
 
-    # Mock repo.create para retornar um Order real
-    def repo_create(order):
-        return Order.create(
-            customer_internal_id=order.customer_internal_id,
-            order_items=order.order_items,
-        )
+    create_use_case.execute(req)
 
-    repo.create.side_effect = repo_create
-    resp = use_case.execute(req)
-    assert resp.customer_internal_id == 1
+    # Host and token are looked up once per order, not once per catalog request
+    assert ssm_client.get_parameter.call_count == 2
 
 
-def test_order_create_use_case_inactive_customer(monkeypatch):
-    repo = MagicMock()
-    use_case = OrderCreateUseCase(repo)
+def test_order_create_use_case_converts_catalog_category(
+    create_use_case, repo, monkeypatch
+):
+    def string_category_catalog(path):
+        if "/product/" in path:
+            return {**_PRODUCT, "category": "burger"}
+        return _fake_catalog(path)
+
     monkeypatch.setattr(
-        use_case,
-        "_fetch_catalog",
-        lambda path: {
-            "is_active": False,
-            "email": "a@a.com",
-            "document": "123",
-            "internal_id": 1,
-            "name": "Test",
-            "price": 10.0,
-            "default_ingredient": [],
-            "category": ProductCategory.BURGER,
-            "sku": "ABC-1234-XYZ",
-            "type": "cheese",
-            "applies_to_burger": True,
-            "applies_to_side": False,
-            "applies_to_drink": False,
-            "applies_to_dessert": False,
-            "quantity": 1,
-        },
+        create_use_case, "_catalog_fetcher", lambda: string_category_catalog
     )
+    created = []
+    repo.create = lambda order: created.append(order) or order
     item_req = OrderItemRequest(
         product_internal_id=1,
         additional_ingredient_internal_ids=[],
         remove_ingredient_internal_ids=[],
     )
+
     req = OrderCreateRequest(customer_internal_id=1, order_items=[item_req])
-    with pytest.raises(ValueError):
-        use_case.execute(req)
 
+    create_use_case.execute(req)
+
+    assert created[0].order_items[0].product.category is ProductCategory.BURGER
+
+
+def test_order_create_use_case_checks_customer_before_products(
+    create_use_case, repo, monkeypatch
+):
+    calls = []
+
+    def no_customer_catalog(path):
+        calls.append(path)
+        if "/customer/" in path:
+            return None
+        return _fake_catalog(path)
 
-def test_order_create_use_case_missing_catalog(monkeypatch):
-    repo = MagicMock()
-    use_case = OrderCreateUseCase(repo)
-    monkeypatch.setattr(use_case, "_fetch_catalog", lambda path: None)
+    monkeypatch.setattr(create_use_case, "_catalog_fetcher", lambda: no_customer_catalog)
     item_req = OrderItemRequest(
         product_internal_id=1,
-        additional_ingredient_internal_ids=[],
+        additional_ingredient_internal_ids=[1],
         remove_ingredient_internal_ids=[],
     )
     req = OrderCreateRequest(customer_internal_id=1, order_items=[item_req])
-    with pytest.raises(ValueError):
-        use_case.execute(req)
+
+    with pytest.raises(ValueError, match="Customer with ID 1 not found"):
+        create_use_case.execute(req)
+
+    assert calls == ["/customer/by-id/1?include_inactive=false"]
+
+
+def _item(product_id, additional=()):
+    return OrderItemRequest(
+        product_internal_id=product_id,
+        additional_ingredient_internal_ids=list(additional),
+        remove_ingredient_internal_ids=[],
+    )
+
+
+def _first_item_ingredient_missing(path):
+    if path.startswith("/ingredient/by-id/9"):
+        return None
+    if path.startswith("/product/by-id/2"):
+        return None
+    return _fake_catalog(path)
+
+
+def _first_item_product_missing(path):
+    if path.startswith("/product/by-id/1"):
+        return None
+    if path.startswith("/product/by-id/2"):
+        raise ValueError("Failed to reach catalog service: boom")
+    return _fake_catalog(path)
+
+
+@pytest.mark.parametrize(
+    "catalog,order_items,message",
+    [
+        (
+            _first_item_ingredient_missing,
+            [_item(1, additional=[9]), _item(2)],
+            "Ingredient with ID 9 not found or is deactivated",
+        ),
+        (
+            _first_item_product_missing,
+            [_item(1), _item(2)],
+            "Product with ID 1 not found or is deactivated",
+        ),
+    ],
+    ids=["item_ingredient_before_next_product", "missing_before_fetch_error"],
+)
+def test_order_create_use_case_reports_first_invalid_item(
+    create_use_case, monkeypatch, catalog, order_items, message
+):
+    monkeypatch.setattr(create_use_case, "_catalog_fetcher", lambda: catalog)
+    req = OrderCreateRequest(customer_internal_id=1, order_items=order_items)
+
+    with pytest.raises(ValueError, match=message):
+        create_use_case.execute(req)
@@ -3,55 +3,54 @@ Comprehensive tests for SQLOrderRepository to increase coverage.
 Focuses on get_by_id, list_all, update, cancel, update_status, process_payment, find_by_status.
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from datetime import datetime
 
-from src.adapters.gateways.sql_order_repository import (
-    SQLOrderRepository,
-    OrderModel,
-    OrderItemModel,
-)
+import pytest
+
+from src.adapters.gateways.sql_order_repository import SQLOrderRepository
 from src.entities.order import Order, OrderItem
-from src.entities.product import Product, ProductCategory
+from src.entities.product import Product, ProductCategory, ProductReceiptItem
 from src.entities.ingredient import Ingredient, IngredientType
 from src.entities.value_objects.money import Money
 from src.entities.value_objects.order_status import OrderStatus, OrderStatusType
 from src.entities.value_objects.name import Name
 from src.entities.value_objects.sku import SKU
 
+pytestmark = [pytest.mark.unit]
+
+_FROZEN_NOW = datetime(2026, 1, 6, 12, 0, 0)
 
-def create_mock_order_model(internal_id=1, status="RECEBIDO"):
-    """Factory to create OrderModel mock"""
-    order_model = MagicMock(spec=OrderModel)
-    order_model.internal_id = internal_id
-    order_model.customer_internal_id = 1
-    order_model.value = 50.0
-    order_model.status = status
-    order_model.start_date = datetime.now()
-    order_model.end_date = None
-    order_model.has_payment_verified = False
-    order_model.payment_date = None
-    order_model.payment_transaction_id = None
-    order_model.payment_message = None
-    order_model.order_display_id = "001"
-
-    # Create mock order item
-    item_model = MagicMock(spec=OrderItemModel)
-    item_model.internal_id = 1
-    item_model.product_internal_id = 1
-    item_model.additional_ingredient_internal_ids = []
-    item_model.remove_ingredient_internal_ids = []
-    item_model.item_receipt = []
-    item_model.price = 50.0
-
-    order_model.order_items = [item_model]
-    return order_model
+
+def create_mock_order_model(internal_id=1, status="RECEBIDO", start_date=_FROZEN_NOW):
+    """Factory to create a data-only OrderModel stand-in"""
+    item_model = SimpleNamespace(
+        internal_id=1,
+        product_internal_id=1,
+        additional_ingredient_internal_ids=[],
+        remove_ingredient_internal_ids=[],
+        item_receipt=[],
+        price=50.0,
+    )
+    return SimpleNamespace(
+        internal_id=internal_id,
+        customer_internal_id=1,
+        value=50.0,
+        status=status,
+        start_date=start_date,
+        end_date=None,
+        has_payment_verified=False,
+        payment_date=None,
+        payment_transaction_id=None,
+        payment_message=None,
+        order_display_id="001",
+        order_items=[item_model],
+    )
 
 
 def create_mock_product(internal_id=1):
     """Factory to create Product entity"""
-    from src.entities.product import ProductReceiptItem
-
     # Create ingredient for product
     ingredient = create_mock_ingredient(internal_id=1)
 
@@ -83,234 +82,164 @@ def create_mock_ingredient(internal_id=1):
     )
 
 
-def test_get_by_id_found():
-    """Given order exists, when get_by_id is called, then Order entity is returned"""
-    # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_product_repo = MagicMock()
-    mock_ingredient_repo = MagicMock()
-
-    order_model = create_mock_order_model(internal_id=1)
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = order_model
-
-    mock_product_repo.find_by_id.return_value = create_mock_product()
-
-    repo = SQLOrderRepository(mock_db, mock_product_repo, mock_ingredient_repo)
-
-    # Act
-    result = repo.get_by_id(1)
-
-    # Assert
-    assert result is not None
-    assert result.internal_id == 1
-    mock_session.query.assert_called_once()
-
-
-def test_get_by_id_not_found():
-    """Given order does not exist, when get_by_id is called, then None is returned"""
-    # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = None
-
-    repo = SQLOrderRepository(mock_db)
-
-    # Act
-    result = repo.get_by_id(999)
-
-    # Assert
-    assert result is None
-
-
-def test_list_all_with_pagination():
-    """Given multiple orders exist, when list_all is called with skip/limit, then paginated list is returned"""
-    # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_product_repo = MagicMock()
-    mock_ingredient_repo = MagicMock()
-
-    order_models = [
-        create_mock_order_model(internal_id=1),
-        create_mock_order_model(internal_id=2),
-        create_mock_order_model(internal_id=3),
-    ]
-
-    mock_query = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.offset.return_value = mock_query
-    mock_query.limit.return_value = mock_query
-    mock_query.all.return_value = order_models
-
-    mock_product_repo.find_by_id.return_value = create_mock_product()
-
-    repo = SQLOrderRepository(mock_db, mock_product_repo, mock_ingredient_repo)
-
-    # Act
-    result = repo.list_all(skip=0, limit=10)
+SAMPLE_PRODUCT = create_mock_product()
+SAMPLE_ORDER_ITEM = OrderItem(
+    order_internal_id=1,
+    product=SAMPLE_PRODUCT,
+    additional_ingredient=[],
+    remove_ingredient=[],
+)
+# Read-only order passed to update(); the repository never mutates it
+SAMPLE_UPDATE_ORDER = Order(
+    customer_internal_id=1,
+    order_items=[SAMPLE_ORDER_ITEM],
+    value=Money(amount=60.0),
+    status=OrderStatus.create("EM_PREPARACAO"),
+    internal_id=1,
+    _skip_active_validation=True,
+)
 
-    # Assert
-    assert len(result) == 3
-    mock_query.offset.assert_called_once_with(0)
-    mock_query.limit.assert_called_once_with(10)
 
+@pytest.fixture
+def mock_repo_ctx(fake_session):
+    """SQLOrderRepository whose database hands out this test's FakeSession"""
+    db = MagicMock()
+    db.get_session.return_value = fake_session
 
-def test_find_by_status_filters_correctly():
-    """Given orders with specific status, when find_by_status is called, then filtered orders returned"""
-    # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
+    product_repo = MagicMock()
+    product_repo.find_by_id.return_value = SAMPLE_PRODUCT
+    ingredient_repo = MagicMock()
 
-    mock_product_repo = MagicMock()
-    mock_ingredient_repo = MagicMock()
+    return SimpleNamespace(
+        db=db,
+        session=fake_session,
+        query=fake_session.results,
+        product_repo=product_repo,
+        ingredient_repo=ingredient_repo,
+        repo=SQLOrderRepository(db, product_repo, ingredient_repo),
+    )
 
-    order_models = [
-        create_mock_order_model(internal_id=1, status="RECEBIDO"),
-        create_mock_order_model(internal_id=2, status="RECEBIDO"),
-    ]
 
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.all.return_value = order_models
+class TestReadOnly:
+    """Lookups that never commit"""
 
-    mock_product_repo.find_by_id.return_value = create_mock_product()
+    def test_get_by_id_found(self, mock_repo_ctx):
+        """Given order exists, when get_by_id is called, then Order entity is returned"""
+        # Arrange
+        ctx = mock_repo_ctx
+        order_model = create_mock_order_model(internal_id=1)
 
-    repo = SQLOrderRepository(mock_db, mock_product_repo, mock_ingredient_repo)
+        ctx.query.first_result = order_model
 
-    # Act
-    result = repo.get_by_status("RECEBIDO")
+        repo = ctx.repo
 
-    # Assert
-    assert len(result) == 2
-    assert all(order.status.value == "RECEBIDO" for order in result)
+        # Act
+        result = repo.get_by_id(1)
 
+        # Assert
+        assert result is not None
+        assert result.internal_id == 1
+        assert ctx.session.count("query") == 1
 
-def test_update_order_success():
+    @pytest.mark.parametrize(
+        "method,kwargs,n_models",
+        [
+            ("list_all", {"skip": 0, "limit": 10}, 3),
+            ("get_by_status", {"status": "RECEBIDO"}, 2),
+        ],
+    )
+    def test_list_queries_return_every_model(
+        self, mock_repo_ctx, method, kwargs, n_models
+    ):
+        """Given matching orders exist, when a list query is called, then every model is converted"""
+        # Arrange
+        ctx = mock_repo_ctx
+        ctx.query.all_result = [
+            create_mock_order_model(internal_id=i, status="RECEBIDO")
+            for i in range(1, n_models + 1)
+        ]
+
+        # Act
+        result = getattr(ctx.repo, method)(**kwargs)
+
+        # Assert
+        assert len(result) == n_models
+        assert all(order.status.value == "RECEBIDO" for order in result)
+
+    def test_list_all_applies_pagination(self, mock_repo_ctx):
+        """Given skip/limit, when list_all is called, then they are applied to the query"""
+        mock_repo_ctx.repo.list_all(skip=5, limit=10)
+
+        assert mock_repo_ctx.query.offset_args == [5]
+        assert mock_repo_ctx.query.limit_args == [10]
+
+    def test_get_payment_status_success(self, mock_repo_ctx):
+        """Given order with payment, when get_payment_status is called, then payment dict is returned"""
+        # Arrange
+        ctx = mock_repo_ctx
+        order_model = create_mock_order_model(internal_id=1)
+        order_model.payment_transaction_id = "TXN123"
+        order_model.has_payment_verified = True
+        order_model.payment_date = _FROZEN_NOW
+        order_model.payment_message = "Approved"
+
+        ctx.query.first_result = order_model
+
+        repo = ctx.repo
+
+        # Act
+        result = repo.get_payment_status(1)
+
+        # Assert
+        assert result is not None
+        assert result["payment_transaction_id"] == "TXN123"
+        assert result["has_payment_verified"] is True
+        assert result["payment_message"] == "Approved"
+        assert result["payment_date"] == _FROZEN_NOW.isoformat()
+
+
+def test_update_order_success(mock_repo_ctx):
     """Given existing order, when update is called, then order is updated in database"""
     # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_product_repo = MagicMock()
-    mock_ingredient_repo = MagicMock()
-
+    ctx = mock_repo_ctx
     order_model = create_mock_order_model(internal_id=1)
 
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = order_model
-
-    mock_product_repo.find_by_id.return_value = create_mock_product()
-
-    # Create order entity with valid order items
-    product = create_mock_product()
-    order_item = OrderItem(
-        order_internal_id=1,
-        product=product,
-        additional_ingredient=[],
-        remove_ingredient=[],
-    )
+    ctx.query.first_result = order_model
 
-    order = Order(
-        customer_internal_id=1,
-        order_items=[order_item],
-        value=Money(amount=60.0),
-        status=OrderStatus.create("EM_PREPARACAO"),
-        internal_id=1,
-        _skip_active_validation=True,
-    )
-
-    repo = SQLOrderRepository(mock_db, mock_product_repo, mock_ingredient_repo)
+    repo = ctx.repo
 
     # Act
-    result = repo.update(order)
+    result = repo.update(SAMPLE_UPDATE_ORDER)
 
     # Assert
     assert result is not None
     assert order_model.value == 60.0
     assert order_model.status == "EM_PREPARACAO"
-    mock_session.commit.assert_called()
+    assert ctx.session.count("commit") == 1
 
 
-def test_update_order_not_found():
+def test_update_order_not_found(mock_repo_ctx):
     """Given non-existent order, when update is called, then ValueError is raised"""
     # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = None
-
-    # Create valid order with items using correct OrderItem signature
-    product = create_mock_product()
-    order_item = OrderItem(
-        order_internal_id=999,
-        product=product,
-        additional_ingredient=[],
-        remove_ingredient=[],
-    )
+    ctx = mock_repo_ctx
+    ctx.query.first_result = None
 
-    order = Order(
-        customer_internal_id=1,
-        order_items=[order_item],
-        value=Money(amount=50.0),
-        status=OrderStatus.create("RECEBIDO"),
-        internal_id=999,
-        _skip_active_validation=True,
-    )
-
-    repo = SQLOrderRepository(mock_db)
+    repo = ctx.repo
 
     # Act & Assert
-    try:
-        repo.update(order)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "not found" in str(e)
+    with pytest.raises(ValueError, match="not found"):
+        repo.update(SAMPLE_UPDATE_ORDER)
 
 
-def test_cancel_order_success():
+def test_cancel_order_success(mock_repo_ctx):
     """Given existing order, when cancel is called, then status is changed to CANCELADO"""
     # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
+    ctx = mock_repo_ctx
     order_model = create_mock_order_model(internal_id=1, status="RECEBIDO")
 
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = order_model
+    ctx.query.first_result = order_model
 
-    repo = SQLOrderRepository(mock_db)
+    repo = ctx.repo
 
     # Act
     result = repo.cancel(1)
@@ -318,52 +247,18 @@ def test_cancel_order_success():
     # Assert
     assert result is True
     assert order_model.status == OrderStatusType.CANCELADO.value
-    mock_session.commit.assert_called_once()
-
-
-def test_cancel_order_not_found():
-    """Given non-existent order, when cancel is called, then False is returned"""
-    # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = None
-
-    repo = SQLOrderRepository(mock_db)
-
-    # Act
-    result = repo.cancel(999)
-
-    # Assert
-    assert result is False
+    assert ctx.session.count("commit") == 1
 
 
-def test_update_status_success():
+def test_update_status_success(mock_repo_ctx):
     """Given existing order, when update_status is called, then status is updated"""
     # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_product_repo = MagicMock()
-    mock_ingredient_repo = MagicMock()
-
+    ctx = mock_repo_ctx
     order_model = create_mock_order_model(internal_id=1, status="RECEBIDO")
 
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = order_model
-
-    mock_product_repo.find_by_id.return_value = create_mock_product()
+    ctx.query.first_result = order_model
 
-    repo = SQLOrderRepository(mock_db, mock_product_repo, mock_ingredient_repo)
+    repo = ctx.repo
 
     # Act
     result = repo.update_status(1, "EM_PREPARACAO")
@@ -371,186 +266,82 @@ def test_update_status_success():
     # Assert
     assert result is not None
     assert order_model.status == "EM_PREPARACAO"
-    mock_session.commit.assert_called()
-    mock_session.refresh.assert_called()
-
-
-def test_update_status_order_not_found():
-    """Given non-existent order, when update_status is called, then None is returned"""
-    # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = None
-
-    repo = SQLOrderRepository(mock_db)
-
-    # Act
-    result = repo.update_status(999, "EM_PREPARACAO")
-
-    # Assert
-    assert result is None
-
-
-def test_process_payment_approved():
-    """Given approved payment, when process_payment is called, then payment is verified and status updated"""
+    assert ctx.session.count("commit") == 1
+    assert ctx.session.count("refresh") > 0
+
+
+@pytest.mark.parametrize(
+    "payment,expected_status,expected_verified",
+    [
+        (
+            {
+                "transaction_id": "TXN123",
+                "date": _FROZEN_NOW,
+                "message": "Payment approved",
+                "approval_status": True,
+            },
+            OrderStatusType.EM_PREPARACAO.value,
+            True,
+        ),
+        (
+            {
+                "transaction_id": "TXN456",
+                "date": _FROZEN_NOW,
+                "message": "Payment rejected",
+                "approval_status": False,
+            },
+            OrderStatusType.CANCELADO.value,
+            False,
+        ),
+    ],
+    ids=["approved", "rejected"],
+)
+def test_process_payment(mock_repo_ctx, payment, expected_status, expected_verified):
+    """Given a payment result, when process_payment is called, then verification and status follow the approval"""
     # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_product_repo = MagicMock()
-    mock_ingredient_repo = MagicMock()
-
+    ctx = mock_repo_ctx
     order_model = create_mock_order_model(internal_id=1, status="RECEBIDO")
 
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = order_model
-
-    mock_product_repo.find_by_id.return_value = create_mock_product()
-
-    payment_data = {
-        "transaction_id": "TXN123",
-        "date": datetime.now(),
-        "message": "Payment approved",
-        "approval_status": True,
-    }
+    ctx.query.first_result = order_model
 
-    repo = SQLOrderRepository(mock_db, mock_product_repo, mock_ingredient_repo)
+    repo = ctx.repo
 
     # Act
-    result = repo.process_payment(1, payment_data)
+    result = repo.process_payment(1, payment)
 
     # Assert
     assert result is not None
-    assert order_model.has_payment_verified is True
-    assert order_model.payment_transaction_id == "TXN123"
-    assert order_model.status == OrderStatusType.EM_PREPARACAO.value
-    mock_session.commit.assert_called()
-
-
-def test_process_payment_rejected():
-    """Given rejected payment, when process_payment is called, then payment not verified and order cancelled"""
+    assert order_model.has_payment_verified is expected_verified
+    assert order_model.payment_transaction_id == payment["transaction_id"]
+    assert order_model.status == expected_status
+    assert ctx.session.count("commit") == 1
+
+
+NOT_FOUND_CASES = [
+    ("get_by_id", (999,), None),
+    ("cancel", (999,), False),
+    ("update_status", (999, "EM_PREPARACAO"), None),
+    (
+        "process_payment",
+        (999, {"transaction_id": "TXN123", "approval_status": True}),
+        None,
+    ),
+    ("get_payment_status", (999,), None),
+]
+
+
+@pytest.mark.parametrize("method,args,expected", NOT_FOUND_CASES)
+def test_order_not_found(mock_repo_ctx, method, args, expected):
+    """Given order does not exist, when a lookup method is called, then its not-found sentinel is returned"""
     # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_product_repo = MagicMock()
-    mock_ingredient_repo = MagicMock()
-
-    order_model = create_mock_order_model(internal_id=1, status="RECEBIDO")
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = order_model
-
-    mock_product_repo.find_by_id.return_value = create_mock_product()
-
-    payment_data = {
-        "transaction_id": "TXN456",
-        "date": datetime.now(),
-        "message": "Payment rejected",
-        "approval_status": False,
-    }
-
-    repo = SQLOrderRepository(mock_db, mock_product_repo, mock_ingredient_repo)
+    mock_repo_ctx.query.first_result = None
 
     # Act
-    result = repo.process_payment(1, payment_data)
+    result = getattr(mock_repo_ctx.repo, method)(*args)
 
     # Assert
-    assert result is not None
-    assert order_model.has_payment_verified is False
-    assert order_model.status == OrderStatusType.CANCELADO.value
-    mock_session.commit.assert_called()
-
-
-def test_process_payment_order_not_found():
-    """Given non-existent order, when process_payment is called, then None is returned"""
-    # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = None
-
-    payment_data = {"transaction_id": "TXN789", "approval_status": True}
-
-    repo = SQLOrderRepository(mock_db)
-
-    # Act
-    result = repo.process_payment(999, payment_data)
-
-    # Assert
-    assert result is None
-
-
-def test_get_payment_status_success():
-    """Given order with payment, when get_payment_status is called, then payment dict is returned"""
-    # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    order_model = create_mock_order_model(internal_id=1)
-    order_model.payment_transaction_id = "TXN123"
-    order_model.has_payment_verified = True
-    order_model.payment_date = datetime(2026, 1, 6, 10, 0, 0)
-    order_model.payment_message = "Approved"
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = order_model
-
-    repo = SQLOrderRepository(mock_db)
-
-    # Act
-    result = repo.get_payment_status(1)
-
-    # Assert
-    assert result is not None
-    assert result["payment_transaction_id"] == "TXN123"
-    assert result["has_payment_verified"] is True
-    assert result["payment_message"] == "Approved"
-
-
-def test_get_payment_status_order_not_found():
-    """Given non-existent order, when get_payment_status is called, then None is returned"""
-    # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-    mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = None
-
-    repo = SQLOrderRepository(mock_db)
-
-    # Act
-    result = repo.get_payment_status(999)
-
-    # Assert
-    assert result is None
+    assert result is expected
+    assert mock_repo_ctx.session.count("commit") == 0
 
 
 def test_to_entity_without_product_repository_raises_error():
@@ -561,57 +352,39 @@ def test_to_entity_without_product_repository_raises_error():
     order_model = create_mock_order_model(internal_id=1)
 
     # Add order item
-    item_model = MagicMock(spec=OrderItemModel)
-    item_model.internal_id = 1
-    item_model.product_internal_id = 1
-    item_model.additional_ingredient_internal_ids = []
-    item_model.remove_ingredient_internal_ids = []
-    item_model.item_receipt = []
-    item_model.price = 10.0
-    order_model.order_items = [item_model]
+    order_model.order_items[0].price = 10.0
 
     repo = SQLOrderRepository(mock_db, product_repository=None)
 
     # Act & Assert
-    try:
+    with pytest.raises(ValueError, match="Product repository is required"):
         repo._to_entity(order_model)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Product repository is required" in str(e)
 
 
-def test_serialize_and_deserialize_ingredient_internal_ids():
-    """Given list of ingredients, when serializing/deserializing internal_ids, then correct list is returned"""
+def test_serialize_ingredient_internal_ids(cheese_ingredient):
+    """Given list of ingredients, when serializing internal_ids, then their internal_ids are returned"""
     # Arrange
-    mock_db = MagicMock()
-    mock_session = MagicMock()
-
     ingredients = [
-        create_mock_ingredient(internal_id=1),
+        cheese_ingredient,
         create_mock_ingredient(internal_id=2),
     ]
 
-    repo = SQLOrderRepository(mock_db)
+    repo = SQLOrderRepository(MagicMock())
 
-    # Act - Serialize
-    serialized = repo._serialize_ingredient_internal_ids(ingredients, mock_session)
+    # Act
+    serialized = repo._serialize_ingredient_internal_ids(ingredients, MagicMock())
 
-    # Assert - Serialize
+    # Assert
     assert serialized == [1, 2]
 
-    # Act - Deserialize
-    deserialized = repo._deserialize_ingredient_internal_ids(serialized)
-
-    # Assert - Deserialize
-    assert deserialized == [1, 2]
-
 
-def test_deserialize_ingredient_internal_ids_handles_none():
-    """Given None or empty list, when deserializing internal_ids, then empty list is returned"""
-    # Arrange
-    mock_db = MagicMock()
-    repo = SQLOrderRepository(mock_db)
+@pytest.mark.parametrize(
+    "stored,expected",
+    [(None, []), ([], []), ([1, 2], [1, 2])],
+    ids=["none", "empty", "ids"],
+)
+def test_deserialize_ingredient_internal_ids(stored, expected):
+    """Given stored internal_ids, when deserializing, then a list is always returned"""
+    repo = SQLOrderRepository(MagicMock())
 
-    # Act & Assert
-    assert repo._deserialize_ingredient_internal_ids(None) == []
-    assert repo._deserialize_ingredient_internal_ids([]) == []
+    assert repo._deserialize_ingredient_internal_ids(stored) == expected
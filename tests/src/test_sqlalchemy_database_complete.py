@@ -3,487 +3,330 @@ Comprehensive tests for SQLAlchemyDatabase to increase coverage.
 Focuses on error handling, edge cases, and all CRUD operations.
 """
 
-from unittest.mock import MagicMock, PropertyMock
+import pytest
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from src.adapters.gateways.implementations.sqlalchemy_database import SQLAlchemyDatabase
+from src.adapters.gateways.implementations.sqlalchemy_database import (
+    POOL_OPTIONS,
+    QUERY_CACHE_SIZE,
+    SQLAlchemyDatabase,
+)
+from src.adapters.gateways.sql_order_repository import OrderModel
+
+# Baseline with: pytest -m profile --profile -n 0 --no-cov (see prof/combined.prof)
+pytestmark = [pytest.mark.profile]
 
 
 class MockEntity:
     """Mock entity for testing"""
 
-    internal_id = None  # Class attribute for filter queries
+    # The slot descriptor doubles as the class-level column for filter queries
+    __slots__ = ("internal_id",)
+
+    # Column stand-ins for the find_by_field family
+    status = "ACTIVE"
+    category = "VIP"
+    is_active = True
+    email = "test@test.com"
 
     def __init__(self, internal_id=None):
         self.internal_id = internal_id
 
 
-def test_add_success():
+# Shared entities for tests that only pass them through and compare identity
+_E1, _E2, _E3 = (MockEntity(internal_id=i) for i in (1, 2, 3))
+
+
+def test_add_success(in_memory_db, fake_session):
     """Given valid entity, when add is called, then entity is added and flushed"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    entity = MockEntity(internal_id=1)
+    entity = _E1
 
     # Act
-    result = db.add(mock_session, entity)
+    result = in_memory_db.add(fake_session, entity)
 
     # Assert
-    mock_session.add.assert_called_once_with(entity)
-    mock_session.flush.assert_called_once()
+    assert fake_session.calls.count(("add", entity)) == 1
+    assert fake_session.count("flush") == 1
     assert result == entity
 
 
-def test_add_with_sqlalchemy_error():
-    """Given SQLAlchemy error on flush, when add is called, then ValueError is raised and rollback is called"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_session.flush.side_effect = SQLAlchemyError("Database error")
-    entity = MockEntity()
-
-    # Act & Assert
-    try:
-        db.add(mock_session, entity)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Error adding entity" in str(e)
-        mock_session.rollback.assert_called_once()
-
-
-def test_update_success():
+def test_update_success(in_memory_db, fake_session):
     """Given valid entity, when update is called, then entity is merged and flushed"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    entity = MockEntity(internal_id=1)
-    mock_session.merge.return_value = entity
+    entity = _E1
 
     # Act
-    result = db.update(mock_session, entity)
+    result = in_memory_db.update(fake_session, entity)
 
     # Assert
-    mock_session.merge.assert_called_once_with(entity)
-    mock_session.flush.assert_called_once()
+    assert fake_session.calls.count(("merge", entity)) == 1
+    assert fake_session.count("flush") == 1
     assert result == entity
 
 
-def test_update_with_sqlalchemy_error():
-    """Given SQLAlchemy error on merge, when update is called, then ValueError is raised and rollback is called"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_session.merge.side_effect = SQLAlchemyError("Constraint violation")
-    entity = MockEntity()
-
-    # Act & Assert
-    try:
-        db.update(mock_session, entity)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Error updating entity" in str(e)
-        mock_session.rollback.assert_called_once()
-
-
-def test_delete_success():
+def test_delete_success(in_memory_db, fake_session):
     """Given valid entity, when delete is called, then entity is deleted and True is returned"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    entity = MockEntity(internal_id=1)
+    entity = _E1
 
     # Act
-    result = db.delete(mock_session, entity)
+    result = in_memory_db.delete(fake_session, entity)
 
     # Assert
-    mock_session.delete.assert_called_once_with(entity)
+    assert fake_session.calls.count(("delete", entity)) == 1
     assert result is True
 
 
-def test_delete_with_sqlalchemy_error():
-    """Given SQLAlchemy error on delete, when delete is called, then ValueError is raised and rollback is called"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_session.delete.side_effect = SQLAlchemyError("Foreign key constraint")
-    entity = MockEntity()
-
-    # Act & Assert
-    try:
-        db.delete(mock_session, entity)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Error deleting entity" in str(e)
-        mock_session.rollback.assert_called_once()
-
-
-def test_find_by_id_found():
+def test_find_by_id_found(in_memory_db, fake_session):
     """Given entity exists, when find_by_id is called, then entity is returned"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    entity = MockEntity(internal_id=1)
-
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = entity
+    entity = _E1
+    fake_session.identity_map[(MockEntity, 1)] = entity
 
     # Act
-    result = db.find_by_id(mock_session, MockEntity, 1)
+    result = in_memory_db.find_by_id(fake_session, MockEntity, 1)
 
     # Assert
     assert result == entity
-    mock_session.query.assert_called_once_with(MockEntity)
+    assert fake_session.calls == [("get", MockEntity, 1)]
 
 
-def test_find_by_id_not_found():
+def test_find_by_id_not_found(in_memory_db, fake_session):
     """Given entity does not exist, when find_by_id is called, then None is returned"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = None
-
     # Act
-    result = db.find_by_id(mock_session, MockEntity, 999)
+    result = in_memory_db.find_by_id(fake_session, MockEntity, 999)
 
     # Assert
     assert result is None
 
 
-def test_find_by_id_with_sqlalchemy_error():
-    """Given SQLAlchemy error, when find_by_id is called, then ValueError is raised"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_session.query.side_effect = SQLAlchemyError("Connection error")
-
-    # Act & Assert
-    try:
-        db.find_by_id(mock_session, MockEntity, 1)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Error finding entity by ID" in str(e)
-
-
-def test_find_all_success():
+def test_find_all_success(in_memory_db, fake_session):
     """Given entities exist, when find_all is called, then list of entities is returned"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_query = MagicMock()
-    entities = [MockEntity(internal_id=1), MockEntity(internal_id=2)]
-
-    mock_session.query.return_value = mock_query
-    mock_query.all.return_value = entities
+    entities = [_E1, _E2]
+    fake_session.results.all_result = entities
 
     # Act
-    result = db.find_all(mock_session, MockEntity)
+    result = in_memory_db.find_all(fake_session, MockEntity)
 
     # Assert
     assert result == entities
     assert len(result) == 2
 
 
-def test_find_all_with_sqlalchemy_error():
-    """Given SQLAlchemy error, when find_all is called, then ValueError is raised"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_session.query.side_effect = SQLAlchemyError("Query error")
-
-    # Act & Assert
-    try:
-        db.find_all(mock_session, MockEntity)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Error finding all entities" in str(e)
-
-
-def test_find_by_field_success():
+def test_find_by_field_success(in_memory_db, fake_session):
     """Given valid field name, when find_by_field is called, then entity is returned"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    entity = MockEntity(internal_id=1)
-
-    MockEntity.internal_id = PropertyMock(return_value=1)
+    entity = _E1
 
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = entity
+    fake_session.results.first_result = entity
 
     # Act
-    result = db.find_by_field(mock_session, MockEntity, "internal_id", 1)
+    result = in_memory_db.find_by_field(fake_session, MockEntity, "internal_id", 1)
 
     # Assert
     assert result == entity
 
 
-def test_find_by_field_invalid_field_name():
+def test_find_by_field_invalid_field_name(in_memory_db, fake_session):
     """Given invalid field name, when find_by_field is called, then ValueError is raised"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-
-    # Act & Assert
-    try:
-        db.find_by_field(mock_session, MockEntity, "nonexistent_field", "value")
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Invalid field name 'nonexistent_field'" in str(e)
-
-
-def test_find_by_field_with_sqlalchemy_error():
-    """Given SQLAlchemy error, when find_by_field is called, then ValueError is raised"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-
-    MockEntity.internal_id = PropertyMock(return_value=1)
-    mock_session.query.side_effect = SQLAlchemyError("Connection lost")
-
     # Act & Assert
-    try:
-        db.find_by_field(mock_session, MockEntity, "internal_id", 1)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Error finding entity by field" in str(e)
+    with pytest.raises(ValueError, match="Invalid field name 'nonexistent_field'"):
+        in_memory_db.find_by_field(
+            fake_session, MockEntity, "nonexistent_field", "value"
+        )
 
 
-def test_find_all_by_field_multiple_results():
+def test_find_all_by_field_multiple_results(in_memory_db, fake_session):
     """Given multiple entities match field, when find_all_by_field is called, then list is returned"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    entities = [
-        MockEntity(internal_id=1),
-        MockEntity(internal_id=2),
-        MockEntity(internal_id=3),
-    ]
-
-    MockEntity.status = PropertyMock(return_value="ACTIVE")
-
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.all.return_value = entities
+    entities = [_E1, _E2, _E3]
+
+    fake_session.results.all_result = entities
 
     # Act
-    result = db.find_all_by_field(mock_session, MockEntity, "status", "ACTIVE")
+    result = in_memory_db.find_all_by_field(
+        fake_session, MockEntity, "status", "ACTIVE"
+    )
 
     # Assert
     assert result == entities
     assert len(result) == 3
 
 
-def test_find_all_by_field_invalid_field():
+def test_find_all_by_field_invalid_field(in_memory_db, fake_session):
     """Given invalid field name, when find_all_by_field is called, then ValueError is raised"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-
     # Act & Assert
-    try:
-        db.find_all_by_field(mock_session, MockEntity, "invalid_field", "value")
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Invalid field name 'invalid_field'" in str(e)
+    with pytest.raises(ValueError, match="Invalid field name 'invalid_field'"):
+        in_memory_db.find_all_by_field(
+            fake_session, MockEntity, "invalid_field", "value"
+        )
 
 
-def test_find_all_by_boolean_field_success():
+def test_find_all_by_boolean_field_success(in_memory_db, fake_session):
     """Given boolean field, when find_all_by_boolean_field is called, then matching entities returned"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    entities = [MockEntity(internal_id=1)]
-
-    MockEntity.is_active = PropertyMock(return_value=True)
+    entities = [_E1]
 
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.all.return_value = entities
+    fake_session.results.all_result = entities
 
     # Act
-    result = db.find_all_by_boolean_field(mock_session, MockEntity, "is_active", True)
+    result = in_memory_db.find_all_by_boolean_field(
+        fake_session, MockEntity, "is_active", True
+    )
 
     # Assert
     assert result == entities
 
 
-def test_find_all_by_multiple_fields_success():
+def test_find_all_by_multiple_fields_success(in_memory_db, fake_session):
     """Given multiple field filters, when find_all_by_multiple_fields is called, then filtered entities returned"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_query = MagicMock()
-    entities = [MockEntity(internal_id=1)]
+    entities = [_E1]
 
-    MockEntity.status = PropertyMock(return_value="ACTIVE")
-    MockEntity.category = PropertyMock(return_value="VIP")
-
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_query  # Chain filters
-    mock_query.all.return_value = entities
+    fake_session.results.all_result = entities
 
     # Act
-    result = db.find_all_by_multiple_fields(
-        mock_session, MockEntity, {"status": "ACTIVE", "category": "VIP"}
+    result = in_memory_db.find_all_by_multiple_fields(
+        fake_session, MockEntity, {"status": "ACTIVE", "category": "VIP"}
     )
 
     # Assert
     assert result == entities
+    assert len(fake_session.results.filters) == 1
+    assert len(fake_session.results.filters[0]) == 2
 
 
-def test_exists_by_field_true():
+def test_exists_by_field_true(in_memory_db, fake_session):
     """Given entity exists with field value, when exists_by_field is called, then True is returned"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-
-    MockEntity.email = PropertyMock(return_value="test@test.com")
 
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = MockEntity()
+    fake_session.results.first_result = _E1
 
     # Act
-    result = db.exists_by_field(mock_session, MockEntity, "email", "test@test.com")
+    result = in_memory_db.exists_by_field(
+        fake_session, MockEntity, "email", "test@test.com"
+    )
 
     # Assert
     assert result is True
 
 
-def test_exists_by_field_false():
+def test_exists_by_field_false(in_memory_db, fake_session):
     """Given entity does not exist, when exists_by_field is called, then False is returned"""
     # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
 
-    MockEntity.email = PropertyMock(return_value="test@test.com")
-
-    mock_session.query.return_value = mock_query
-    mock_query.filter.return_value = mock_filter
-    mock_filter.first.return_value = None
+    fake_session.results.first_result = None
 
     # Act
-    result = db.exists_by_field(
-        mock_session, MockEntity, "email", "nonexistent@test.com"
+    result = in_memory_db.exists_by_field(
+        fake_session, MockEntity, "email", "nonexistent@test.com"
     )
 
     # Assert
     assert result is False
 
 
-def test_commit_success():
+def test_commit_success(in_memory_db, fake_session):
     """Given valid session, when commit is called, then session is committed"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-
     # Act
-    db.commit(mock_session)
+    in_memory_db.commit(fake_session)
 
     # Assert
-    mock_session.commit.assert_called_once()
-
-
-def test_commit_with_error():
-    """Given commit error, when commit is called, then ValueError is raised and rollback is called"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_session.commit.side_effect = SQLAlchemyError("Commit failed")
-
-    # Act & Assert
-    try:
-        db.commit(mock_session)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Error committing transaction" in str(e)
-        mock_session.rollback.assert_called_once()
+    assert fake_session.count("commit") == 1
 
 
-def test_rollback_success():
+def test_rollback_success(in_memory_db, fake_session):
     """Given valid session, when rollback is called, then session is rolled back"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-
     # Act
-    db.rollback(mock_session)
+    in_memory_db.rollback(fake_session)
 
     # Assert
-    mock_session.rollback.assert_called_once()
+    assert fake_session.count("rollback") == 1
 
 
-def test_rollback_with_error():
-    """Given rollback error, when rollback is called, then ValueError is raised"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_session.rollback.side_effect = SQLAlchemyError("Rollback failed")
-
-    # Act & Assert
-    try:
-        db.rollback(mock_session)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Error rolling back transaction" in str(e)
+def test_close_session_success(in_memory_db, fake_session):
+    """Given valid session, when close_session is called, then session is closed"""
+    # Act
+    in_memory_db.close_session(fake_session)
 
+    # Assert
+    assert fake_session.count("close") == 1
 
-def test_close_session_success():
-    """Given valid session, when close_session is called, then session is closed"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
 
+def test_get_session_returns_session(in_memory_db):
+    """Given database instance, when get_session is called, then Session instance is returned"""
     # Act
-    db.close_session(mock_session)
+    session = in_memory_db.get_session()
 
     # Assert
-    mock_session.close.assert_called_once()
+    assert session is not None
+    assert isinstance(session, Session)
 
 
-def test_close_session_with_error():
-    """Given close error, when close_session is called, then ValueError is raised"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
-    mock_session = MagicMock(spec=Session)
-    mock_session.close.side_effect = SQLAlchemyError("Close failed")
+def test_engine_uses_compiled_query_cache(in_memory_db):
+    """Given database instance, when the engine is inspected, then its compiled query cache is enabled"""
+    assert QUERY_CACHE_SIZE > 0
+    assert in_memory_db.engine._compiled_cache.capacity == QUERY_CACHE_SIZE
 
-    # Act & Assert
-    try:
-        db.close_session(mock_session)
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Error closing session" in str(e)
 
+def test_engine_configured_with_lifo():
+    """Given a PostgreSQL URL, when the database is built, then the pool is LIFO and sized from POOL_OPTIONS"""
+    # Act
+    pool = SQLAlchemyDatabase(database_url="postgresql://u:p@localhost/db").engine.pool
+
+    # Assert
+    assert pool._pool.use_lifo is True
+    assert pool.size() == POOL_OPTIONS["pool_size"]
+    assert pool._max_overflow == POOL_OPTIONS["max_overflow"]
 
-def test_get_session_returns_session():
-    """Given database instance, when get_session is called, then Session instance is returned"""
-    # Arrange
-    db = SQLAlchemyDatabase(database_url="sqlite:///:memory:")
 
+def test_fields_use_mapper_attributes_and_are_cached(in_memory_db):
+    """Given a mapped model, when its fields are looked up, then mapped attribute names are cached per class"""
     # Act
-    session = db.get_session()
+    fields = in_memory_db._fields(OrderModel)
 
     # Assert
-    assert session is not None
-    assert isinstance(session, Session)
+    assert {"status", "order_items"} <= fields
+    assert "metadata" not in fields
+    assert in_memory_db._fields(OrderModel) is fields
+
+
+SQLALCHEMY_ERROR_CASES = [
+    # (db method, args after session, failing session method, raised by db, rollbacks)
+    ("add", (_E1,), "flush", "Error adding entity", 1),
+    ("update", (_E1,), "merge", "Error updating entity", 1),
+    ("delete", (_E1,), "delete", "Error deleting entity", 1),
+    ("find_by_id", (MockEntity, 1), "get", "Error finding entity by ID", 0),
+    ("find_all", (MockEntity,), "query", "Error finding all entities", 0),
+    (
+        "find_by_field",
+        (MockEntity, "internal_id", 1),
+        "query",
+        "Error finding entity by field",
+        0,
+    ),
+    ("commit", (), "commit", "Error committing transaction", 1),
+    ("rollback", (), "rollback", "Error rolling back transaction", 1),
+    ("close_session", (), "close", "Error closing session", 0),
+]
+
+
+@pytest.mark.parametrize(
+    "op,args,failing,message,rollbacks",
+    SQLALCHEMY_ERROR_CASES,
+    ids=[case[0] for case in SQLALCHEMY_ERROR_CASES],
+)
+def test_sqlalchemy_error_raises_value_error(
+    in_memory_db, fake_session, op, args, failing, message, rollbacks
+):
+    """Given a SQLAlchemy error in the session, when the db method is called, then ValueError is raised and writes are rolled back"""
+    # Arrange
+    fake_session.side_effects[failing] = SQLAlchemyError("Database error")
+
+    # Act & Assert
+    with pytest.raises(ValueError, match=message):
+        getattr(in_memory_db, op)(fake_session, *args)
+    assert fake_session.count("rollback") == rollbacks
@@ -15,11 +15,19 @@ def test_money_str_repr_add():
     assert m3.amount == 15.0
 
 
-def test_money_invalid():
+@pytest.mark.parametrize(
+    "factory,kwargs",
+    [
+        (Money, {"amount": -1.0}),
+        (Money, {"amount": 1.123}),
+        (SKU.create, {"sku": "invalid"}),
+        (OrderStatus.create, {"status": "INVALID"}),
+    ],
+    ids=["money-negative", "money-precision", "sku", "order-status"],
+)
+def test_invalid_value_object_raises(factory, kwargs):
     with pytest.raises(ValueError):
-        Money(amount=-1.0)
-    with pytest.raises(ValueError):
-        Money(amount=1.123)
+        factory(**kwargs)
 
 
 def test_name_create_and_str():
@@ -32,8 +40,6 @@ def test_sku_create_and_str():
     sku = SKU.create("abc-1234-xyz")
     assert isinstance(sku, SKU)
     assert str(sku) == "ABC-1234-XYZ"
-    with pytest.raises(ValueError):
-        SKU.create("invalid")
 
 
 def test_order_status_create_and_next():
@@ -43,5 +49,17 @@ def test_order_status_create_and_next():
     assert next_s.status == OrderStatusType.EM_PREPARACAO
     assert str(s) == "RECEBIDO"
     assert s.value == "RECEBIDO"
-    with pytest.raises(ValueError):
-        OrderStatus.create("INVALID")
+
+
+@pytest.mark.parametrize(
+    "value_object",
+    [
+        Money(amount=1.0),
+        Name.create("joao"),
+        SKU.create("abc-1234-xyz"),
+        OrderStatus.recebido(),
+    ],
+    ids=["money", "name", "sku", "order_status"],
+)
+def test_value_objects_use_slots(value_object):
+    assert not hasattr(value_object, "__dict__")